@@ -2,7 +2,10 @@ import os
 import json
 import subprocess
 import platform
-import zipfile
+import instances
+import library_verifier
+import launch_args
+import natives
 
 MC_DIR = os.path.expanduser("~/.minecraft") if not platform.system().startswith("Windows") else os.path.join(os.getenv("APPDATA"), ".minecraft")
 
@@ -34,96 +37,42 @@ JAVA_PATH = get_java_path()
 
 # JAVA_PATH = r"C:\Program Files\Eclipse Adoptium\jdk-21.0.9.10-hotspot\bin\java.exe"  # Change if needed
 
-def get_version_json(version_id):
-    path = os.path.join(MC_DIR, "versions", version_id, f"{version_id}.json")
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Version JSON not found: {path}")
-    with open(path, "r", encoding="utf8") as f:
-        return json.load(f)
-
-def build_classpath(version_data):
-    cp = []
-    for lib in version_data["libraries"]:
-        if "natives" in lib:
-            continue
-        name = lib["name"]
-        parts = name.split(":")
-        if len(parts) != 3:
-            continue
-        group, artifact, ver = parts
-        jar_path = os.path.join(MC_DIR, "libraries", *group.split("."), artifact, ver, f"{artifact}-{ver}.jar")
-        if os.path.exists(jar_path):
-            cp.append(jar_path)
-    client_jar = os.path.join(MC_DIR, "versions", version_data["id"], f"{version_data['id']}.jar")
-    cp.append(client_jar)
-    return os.pathsep.join(cp)
-
-def extract_natives(version_data, version_id):
-    natives_path = os.path.join(MC_DIR, "versions", version_id, "natives")
-    os.makedirs(natives_path, exist_ok=True)
-    for lib in version_data["libraries"]:
-        if "natives" not in lib:
-            continue
-        os_name_key = None
-        if platform.system() == "Windows":
-            os_name_key = "windows"
-        elif platform.system() == "Linux":
-            os_name_key = "linux"
-        elif platform.system() == "Darwin":
-            os_name_key = "osx"
-        if os_name_key not in lib["natives"]:
-            continue
-        classifier = lib["natives"][os_name_key]
-        parts = lib["name"].split(":")
-        group, artifact, ver = parts
-        jar_file = os.path.join(MC_DIR, "libraries", *group.split("."), artifact, ver, f"{artifact}-{ver}-{classifier}.jar")
-        if os.path.exists(jar_file):
-            with zipfile.ZipFile(jar_file, "r") as zip_ref:
-                zip_ref.extractall(natives_path)
-    return natives_path
-
-def launch_vanilla(version_id, username="Player"):
-    version_data = get_version_json(version_id)
-    classpath = build_classpath(version_data)
-    natives_path = extract_natives(version_data, version_id)
-    main_class = version_data["mainClass"]
-    cmd = [
-        JAVA_PATH,
-        "-Xmx2G",
-        "-Xms1G",
-        f"-Djava.library.path={natives_path}",
-        "-cp", classpath,
-        main_class,
-        "--username", username,
-        "--version", version_id,
-        "--gameDir", MC_DIR,
-        "--assetsDir", os.path.join(MC_DIR, "assets"),
-        "--assetIndex", version_data.get("assetIndex", {}).get("id", version_id),
-        "--uuid", "0000-0000-0000-0000"
-    ]
+MEMORY_ARGS = ["-Xmx2G", "-Xms1G"]
+
+def launch_command(version_id, username, game_dir=MC_DIR, default_main_class=None):
+    # Everything that only depends on the version comes from launch_args'
+    # cached template; natives are brought up to date on the way
+    template = launch_args.get_template(MC_DIR, version_id)
+    natives.unpack_natives(template["natives_jars"], template["natives_directory"])
+    if not template["main_class"]:
+        template = dict(template, main_class=default_main_class)
+    values = launch_args.launch_values(username, game_dir, launch_args.join_classpath(template["classpath"]))
+    return launch_args.command(JAVA_PATH, template, values, MEMORY_ARGS)
+
+def verify_libraries(version_id):
+    broken = library_verifier.verify(MC_DIR, version_id)
+    for path in broken:
+        print("Repaired:", path)
+
+def launch_vanilla(version_id, username="Player", instance=None, verify=True):
+    if verify:
+        verify_libraries(version_id)
+    game_dir = instances.game_dir(instance)
+    os.makedirs(game_dir, exist_ok=True)
+    cmd = launch_command(version_id, username, game_dir)
     print("Running Vanilla command:", " ".join(cmd))
     subprocess.run(cmd)
 
-def launch_fabric(fabric_version, mc_version, username):
+def launch_fabric(fabric_version, mc_version, username, instance=None, verify=True):
     fabric_id = f"fabric-loader-{fabric_version}-{mc_version}"
-    version_data = get_version_json(fabric_id)
-    classpath = build_classpath(version_data)
-    natives_path = extract_natives(version_data, fabric_id)
-    main_class = version_data.get("mainClass", "net.fabricmc.loader.impl.launch.knot.KnotClient")
-    cmd = [
-        JAVA_PATH,
-        "-Xmx2G",
-        "-Xms1G",
-        f"-Djava.library.path={natives_path}",
-        "-cp", classpath,
-        main_class,
-        "--username", username,
-        "--version", fabric_id,
-        "--gameDir", MC_DIR,
-        "--assetsDir", os.path.join(MC_DIR, "assets"),
-        "--assetIndex", version_data.get("assetIndex", {}).get("id", mc_version),
-        "--uuid", "0000-0000-0000-0000"
-    ]
+    if verify:
+        verify_libraries(fabric_id)
+    game_dir = instances.game_dir(instance)
+    os.makedirs(game_dir, exist_ok=True)
+    cmd = launch_command(
+        fabric_id, username, game_dir,
+        default_main_class="net.fabricmc.loader.impl.launch.knot.KnotClient"
+    )
     print("Running Fabric command:", " ".join(cmd))
     subprocess.run(cmd)
 
@@ -142,6 +91,6 @@ def launch_fabric_from_launcher_data():
 
     _, _, fabric_version, mc_version = fabric_id.split("-", 3)
 
-    launch_fabric(fabric_version, mc_version, username)
+    launch_fabric(fabric_version, mc_version, username, instances.selected(data), data.get("verify_libraries", True))
 
 launch_fabric_from_launcher_data()
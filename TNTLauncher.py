@@ -4,13 +4,45 @@ import json
 import subprocess
 import tkinter as tk
 import re
-import minecraft_launcher_lib
 import webbrowser
 import threading
-import io
+import time
 import requests
+import mod_store
+import http_cache
+from card_grid import VirtualCardGrid
+from search_pager import SearchPager, LocalSearchPager
+import catalog_index
+import mod_installer
+import mods_index
+import mod_updater
+import instances
 from PIL import Image, ImageTk
 
+# ---------- Startup timing ----------
+startup_started = time.perf_counter()
+startup_last = startup_started
+startup_stages = []
+
+def startup_stage(name):
+    global startup_last
+    now = time.perf_counter()
+    startup_stages.append((name, now - startup_last))
+    startup_last = now
+
+def write_startup_log():
+    total = time.perf_counter() - startup_started
+    stages = ", ".join(f"{name}={secs * 1000:.0f}ms" for name, secs in startup_stages)
+    line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} ready in {total * 1000:.0f}ms ({stages})"
+    print("Startup:", line)
+    try:
+        logs_dir = os.path.join(base_dir, "logs")
+        os.makedirs(logs_dir, exist_ok=True)
+        with open(os.path.join(logs_dir, "startup.log"), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass
+
 ICONS = {}
 
 script_dir = os.path.dirname(__file__)  # path to the script itself
@@ -56,11 +88,14 @@ else:
     base_dir = os.path.dirname(os.path.abspath(__file__))
 
 data_file = os.path.join(base_dir, "launcher_data.json")
-MODS_DIR = os.path.join(mc_dir, "mods")
-os.makedirs(MODS_DIR, exist_ok=True)
+
+def instance_dir(sub):
+    # mods/, shaderpacks/... of the selected instance (see instances.py)
+    return instances.content_dir(instances.selected(data), sub)
 
 SEARCH_URL = "https://api.modrinth.com/v2/search"
 VERSION_URL = "https://api.modrinth.com/v2/project/{}/version"
+SEARCH_DEBOUNCE_MS = 350
 
 
 def load_data():
@@ -79,6 +114,7 @@ def save_data():
 
 data = load_data()
 ensure_launcher_profiles()
+startup_stage("data load")
 
 def get_vanilla_versions():
     out = []
@@ -180,7 +216,7 @@ def play_vanilla():
 def play_fabric():
     run_script("FabricLoaderLauncher.py")
 
-def styled_dropdown(parent, values, key):
+def styled_dropdown(parent, values, key, on_select=None):
     var = tk.StringVar(value=data.get(key) or (values[0] if values else ""))
     box = tk.Frame(parent, bg="#2a2a2a", height=40)
     box.pack_propagate(False)
@@ -195,6 +231,14 @@ def styled_dropdown(parent, values, key):
     )
     for v in values:
         lb.insert("end", v)
+    def set_values(new_values):
+        if list(lb.get(0, "end")) == list(new_values):
+            return
+        lb.delete(0, "end")
+        for v in new_values:
+            lb.insert("end", v)
+        if not var.get() and new_values:
+            var.set(new_values[0])
     def toggle():
         if lb.winfo_ismapped():
             lb.place_forget()
@@ -208,10 +252,37 @@ def styled_dropdown(parent, values, key):
         data[key] = val
         save_data()
         lb.place_forget()
+        if on_select:
+            on_select(val)
     lbl.bind("<Button-1>", lambda e: toggle())
     lb.bind("<<ListboxSelect>>", select)
+    box.set_values = set_values
+    box.var = var
     return box
 
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+
+def release_ids(manifest):
+    return [v["id"] for v in manifest.get("versions", []) if v.get("type") == "release"]
+
+def load_version_manifest(callback):
+    # Show whatever is cached right away, then refresh off the Tk thread
+    cached = http_cache.peek(VERSION_MANIFEST_URL)
+    if cached:
+        callback(release_ids(cached))
+
+    def worker():
+        try:
+            manifest = http_cache.get_json(
+                VERSION_MANIFEST_URL,
+                on_update=lambda fresh: root.after(0, lambda: callback(release_ids(fresh)))
+            )
+        except Exception:
+            return
+        root.after(0, lambda: callback(release_ids(manifest)))
+
+    threading.Thread(target=worker, daemon=True).start()
+
 
 def download_skyblock():
     with open("launcher_data.json", "r", encoding="utf-8") as f:
@@ -220,16 +291,11 @@ def download_skyblock():
     fabric_version = data.get("fabric_version", "")
     mc_version = fabric_version.split("-")[-1]
 
-    mods_dir = os.path.join(os.getenv("APPDATA"), ".minecraft", "mods")
-    os.makedirs(mods_dir, exist_ok=True)
+    mods_dir = instance_dir("mods")
 
-    r = requests.get(
-        "https://api.modrinth.com/v2/project/skyblock-infinite/version",
-        timeout=20
+    versions = http_cache.get_json(
+        "https://api.modrinth.com/v2/project/skyblock-infinite/version"
     )
-    r.raise_for_status()
-
-    versions = r.json()
 
     for v in versions:
         if (
@@ -238,13 +304,7 @@ def download_skyblock():
             and "fabric-loader" not in v.get("loaders", [])
         ):
             file = v["files"][0]
-            path = os.path.join(mods_dir, file["filename"])
-
-            with requests.get(file["url"], stream=True) as d:
-                with open(path, "wb") as f:
-                    for c in d.iter_content(8192):
-                        if c:
-                            f.write(c)
+            mod_store.install(file, mods_dir)
             return
 
     raise RuntimeError("No compatible Skyblock version found")
@@ -261,16 +321,11 @@ def download_oneblock():
     fabric_version = data.get("fabric_version", "")
     mc_version = fabric_version.split("-")[-1]
 
-    mods_dir = os.path.join(os.getenv("APPDATA"), ".minecraft", "mods")
-    os.makedirs(mods_dir, exist_ok=True)
+    mods_dir = instance_dir("mods")
 
-    r = requests.get(
-        "https://api.modrinth.com/v2/project/skyblock-infinite/version",
-        timeout=20
+    versions = http_cache.get_json(
+        "https://api.modrinth.com/v2/project/skyblock-infinite/version"
     )
-    r.raise_for_status()
-
-    versions = r.json()
 
     for v in versions:
         if (
@@ -279,13 +334,7 @@ def download_oneblock():
             and "fabric-loader" not in v.get("loaders", [])
         ):
             file = v["files"][0]
-            path = os.path.join(mods_dir, file["filename"])
-
-            with requests.get(file["url"], stream=True) as d:
-                with open(path, "wb") as f:
-                    for c in d.iter_content(8192):
-                        if c:
-                            f.write(c)
+            mod_store.install(file, mods_dir)
             return
 
     raise RuntimeError("No compatible OneBlock version found")
@@ -297,9 +346,7 @@ def update_launcher():
     
 def download_custom_skin_loader(json_path="launcher_data.json"):
     # Determine .minecraft folder
-    mc_dir = os.path.join(os.getenv("APPDATA"), ".minecraft")
-    mods_folder = os.path.join(mc_dir, "mods")
-    os.makedirs(mods_folder, exist_ok=True)
+    mods_folder = instance_dir("mods")
 
     # Read launcher_data.json
     with open(json_path, "r") as f:
@@ -317,28 +364,21 @@ def download_custom_skin_loader(json_path="launcher_data.json"):
     mod_slug = "customskinloader"
     url = f"https://api.modrinth.com/v2/project/{mod_slug}/version?game_versions[]={mc_version}&loaders[]=fabric"
 
-    response = requests.get(url)
-    if response.status_code != 200:
+    try:
+        versions = http_cache.get_json(url)
+    except requests.RequestException:
         print("Failed to fetch mod info from Modrinth")
         return
 
-    versions = response.json()
     if not versions:
         print(f"No CustomSkinLoader version found for Minecraft {mc_version}")
         return
 
     # Get the first (latest compatible) version
     file_info = versions[0]["files"][0]
-    mod_download_url = file_info["url"]
-    file_name = os.path.join(mods_folder, file_info["filename"])
 
     print(f"Downloading CustomSkinLoader for MC {mc_version} into '{mods_folder}'...")
-    r = requests.get(mod_download_url, stream=True)
-    r.raise_for_status()
-
-    with open(file_name, "wb") as f:
-        for chunk in r.iter_content(1024):
-            f.write(chunk)
+    file_name = mod_store.install(file_info, mods_folder)
 
     print(f"Downloaded {file_info['filename']} to '{mods_folder}'")
     return file_name
@@ -358,7 +398,6 @@ class ModrinthBrowser:
     def __init__(self, parent):
         self.root = parent
         self.root.configure(bg="#121212")
-        self.images = {}
 
         self.LAUNCHER_DATA = self.load_launcher_data()
         self.MC_VERSION = self.get_mc_version()
@@ -378,6 +417,15 @@ class ModrinthBrowser:
             command=self.search
         ).pack(side="left")
 
+        tk.Button(
+            top,
+            text="Update all",
+            bg="#d4861c",
+            fg="white",
+            font=("Segoe UI", 11, "bold"),
+            command=self.update_all
+        ).pack(side="left", padx=8)
+
         self.status = tk.Label(
             self.root,
             text="",
@@ -392,17 +440,42 @@ class ModrinthBrowser:
 
         scrollbar = tk.Scrollbar(self.root, command=self.canvas.yview)
         scrollbar.pack(side="right", fill="y")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        self.container = tk.Frame(self.canvas, bg="#121212")
-        self.canvas.create_window((0, 0), window=self.container, anchor="nw")
-        self.container.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.pager = None
+        self.generation = 0
+        self.search_job = None
+        self.last_query = None
+        self.installed = {}
+        self.grid = VirtualCardGrid(
+            self.canvas, scrollbar, self.download, self.load_more,
+            card_state=lambda hit: mods_index.card_state(self.installed, hit)
         )
+        self.refresh_installed(check_updates=True)
+
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
+        self.search_entry.bind("<Return>", lambda e: self.search())
 
         self.search()
 
+    def refresh_installed(self, check_updates=False):
+        def worker():
+            mods_dir = instance_dir("mods")
+            installed = mods_index.installed_projects(mods_dir)
+            self.root.after(0, lambda: self.set_installed(installed))
+            if not check_updates or not self.MC_VERSION:
+                return
+            # Check only, so the cards can show "update"; nothing is replaced
+            try:
+                mod_updater.check_updates(mods_dir, self.MC_VERSION, "fabric")
+            except Exception:
+                return
+            checked = mods_index.installed_projects(mods_dir)
+            self.root.after(0, lambda: self.set_installed(checked))
+        threading.Thread(target=worker, daemon=True).start()
+
+    def set_installed(self, installed):
+        self.installed = installed
+        self.grid.redraw()
+
     def load_launcher_data(self):
         try:
             with open("launcher_data.json", "r", encoding="utf-8") as f:
@@ -423,105 +496,49 @@ class ModrinthBrowser:
             return mc
         return self.LAUNCHER_DATA.get("vanilla_version")
 
-    def search(self):
-        for w in self.container.winfo_children():
-            w.destroy()
-        q = self.search_entry.get().strip()
-        self.status.config(text="Loading mods...")
-        threading.Thread(
-            target=self.fetch_mods,
-            args=(q,),
-            daemon=True
-        ).start()
-
-    def fetch_mods(self, query):
-        params = {
-            "query": query,
-            "facets": '[["categories:fabric"]]',
-            "limit": 40
-        }
-        try:
-            r = requests.get(SEARCH_URL, params=params, timeout=15)
-            r.raise_for_status()
-            mods = r.json()["hits"]
-            self.root.after(0, lambda: self.render_mods(mods))
-            self.root.after(
-                0,
-                lambda: self.status.config(
-                    text=f"Found {len(mods)} Fabric mods (MC {self.MC_VERSION})"
-                )
-            )
-        except Exception as e:
-            self.root.after(
-                0,
-                lambda: self.status.config(text=f"Error: {e}")
-            )
+    def schedule_search(self, event=None):
+        # Search as you type, once typing pauses
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(SEARCH_DEBOUNCE_MS, lambda: self.search(force=False))
 
-    def render_mods(self, mods):
-        cols = 4
-        row = col = 0
-        for mod in mods:
-            card = self.create_card(self.container, mod)
-            card.grid(row=row, column=col, padx=14, pady=14)
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
-
-    def create_card(self, parent, mod):
-        card = tk.Frame(parent, bg="#1e1e1e", width=240, height=300)
-        card.pack_propagate(False)
-
-        icon_lbl = tk.Label(card, bg="#1e1e1e")
-        icon_lbl.pack(pady=10)
-
-        if mod.get("icon_url"):
-            threading.Thread(
-                target=self.load_icon,
-                args=(mod["icon_url"], icon_lbl, mod["project_id"]),
-                daemon=True
-            ).start()
-
-        tk.Label(
-            card,
-            text=mod.get("title", ""),
-            fg="white",
-            bg="#1e1e1e",
-            font=("Segoe UI", 11, "bold"),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(6, 2))
-
-        tk.Label(
-            card,
-            text=mod.get("description", ""),
-            fg="#bbb",
-            bg="#1e1e1e",
-            font=("Segoe UI", 9),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(0, 8))
+    def search(self, force=True):
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+        q = self.search_entry.get().strip()
+        if not force and q == self.last_query:
+            return
+        self.last_query = q
 
-        tk.Button(
-            card,
-            text="DOWNLOAD",
-            bg="#5865f2",
-            fg="white",
-            font=("Segoe UI", 10, "bold"),
-            command=lambda pid=mod["project_id"]: self.download(pid)
-        ).pack(pady=8, ipadx=14, ipady=4)
+        if self.pager:
+            self.pager.cancel()
+        self.generation += 1
+        gen = self.generation
+        self.grid.set_items([])
+        self.status.config(text="Loading mods...")
+        on_items = lambda hits, first, gen=gen: gen == self.generation and self.show_mods(hits, first)
+        on_error = lambda e, gen=gen: gen == self.generation and self.status.config(text=f"Error: {e}")
+        params = {"query": q, "facets": '[["categories:fabric"]]'}
+        if catalog_index.is_ready("mod"):
+            # Answered from the local index, kept fresh in the background;
+            # falls back to SEARCH_URL when the index has too few matches
+            self.pager = LocalSearchPager(self.root, q, {"project_type": "mod", "categories": ["fabric"]}, on_items, on_error, SEARCH_URL, params)
+        else:
+            self.pager = SearchPager(self.root, SEARCH_URL, params, on_items, on_error)
+        catalog_index.refresh_async("mod")
+        self.pager.load_more()
 
-        return card
+    def load_more(self):
+        if self.pager:
+            self.pager.load_more()
 
-    def load_icon(self, url, label, pid):
-        try:
-            r = requests.get(url, timeout=10)
-            img = Image.open(io.BytesIO(r.content)).resize((96, 96))
-            tkimg = ImageTk.PhotoImage(img)
-            self.images[pid] = tkimg
-            self.root.after(0, lambda: label.config(image=tkimg))
-        except:
-            pass
+    def show_mods(self, mods, first_page=True):
+        if first_page:
+            self.grid.set_items(mods)
+        else:
+            self.grid.append_items(mods)
+        self.status.config(text=f"Found {self.pager.total} Fabric mods (MC {self.MC_VERSION})")
 
     def download(self, project_id):
         self.status.config(text="Downloading...")
@@ -533,56 +550,28 @@ class ModrinthBrowser:
 
     def download_thread(self, project_id):
         try:
-            mc_dir = os.path.join(os.getenv("APPDATA"), ".minecraft")
-            mods_dir = os.path.join(mc_dir, "mods")
-            os.makedirs(mods_dir, exist_ok=True)
-
-            r = requests.get(VERSION_URL.format(project_id), timeout=20)
-            r.raise_for_status()
-            versions = r.json()
-
-            for v in versions:
-                if "fabric" not in v.get("loaders", []):
-                    continue
-                if self.MC_VERSION not in v.get("game_versions", []):
-                    continue
-
-                file = None
-                for f in v.get("files", []):
-                    name = f.get("filename", "").lower()
-                    if "fabric-loader" in name:
-                        continue
-                    if f.get("primary") and name.endswith(".jar"):
-                        file = f
-                        break
-
-                if not file:
-                    for f in v.get("files", []):
-                        name = f.get("filename", "").lower()
-                        if "fabric-loader" in name:
-                            continue
-                        if name.endswith(".jar"):
-                            file = f
-                            break
-
-                if not file:
-                    continue
-
-                path = os.path.join(mods_dir, file["filename"])
-
-                with requests.get(file["url"], stream=True, timeout=60) as d:
-                    d.raise_for_status()
-                    with open(path, "wb") as out:
-                        for chunk in d.iter_content(8192):
-                            if chunk:
-                                out.write(chunk)
+            mods_dir = instance_dir("mods")
 
+            def progress(done, total, files_done, files_total):
+                percent = int(done * 100 / total) if total else 100
                 self.root.after(
                     0,
                     lambda: self.status.config(
-                        text=f"Downloaded: {file['filename']}"
+                        text=f"Downloading {files_done}/{files_total} files ({percent}%)"
                     )
                 )
+
+            installed, skipped, missing = mod_installer.install_with_dependencies(
+                [project_id], self.MC_VERSION, mods_dir, "fabric", progress
+            )
+            if project_id not in missing:
+                text = f"Downloaded {len(installed)} file(s)"
+                if skipped:
+                    text += f", {len(skipped)} already installed"
+                if missing:
+                    text += f", {len(missing)} dependencies not found for MC {self.MC_VERSION}"
+                self.root.after(0, lambda: self.status.config(text=text))
+                self.refresh_installed()
                 return
 
             self.root.after(
@@ -593,11 +582,35 @@ class ModrinthBrowser:
             )
 
         except Exception as e:
+            message = f"Download error: {e}"
             self.root.after(
                 0,
-                lambda: self.status.config(
-                    text=f"Download error: {e}"
+                lambda: self.status.config(text=message)
+            )
+
+
+    def update_all(self):
+        self.status.config(text="Checking installed mods for updates...")
+        threading.Thread(target=self.update_all_thread, daemon=True).start()
+
+    def update_all_thread(self):
+        try:
+            def progress(done, total):
+                self.root.after(
+                    0,
+                    lambda: self.status.config(text=f"Updating mods {done}/{total}")
                 )
+
+            updated = mod_updater.update_all(instance_dir("mods"), self.MC_VERSION, "fabric", progress)
+            text = f"Updated {len(updated)} mod(s)" if updated else "All mods are up to date"
+            self.root.after(0, lambda: self.status.config(text=text))
+            self.refresh_installed()
+
+        except Exception as e:
+            message = f"Update error: {e}"
+            self.root.after(
+                0,
+                lambda: self.status.config(text=message)
             )
 
 
@@ -607,7 +620,6 @@ class ModrinthShaders:
     def __init__(self, parent):
         self.root = parent
         self.root.configure(bg="#121212")
-        self.images = {}
 
         top = tk.Frame(self.root, bg="#121212")
         top.pack(fill="x", pady=12)
@@ -637,116 +649,60 @@ class ModrinthShaders:
 
         scrollbar = tk.Scrollbar(self.root, command=self.canvas.yview)
         scrollbar.pack(side="right", fill="y")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.pager = None
+        self.generation = 0
+        self.search_job = None
+        self.last_query = None
+        self.grid = VirtualCardGrid(self.canvas, scrollbar, self.download, self.load_more)
 
-        self.container = tk.Frame(self.canvas, bg="#121212")
-        self.canvas.create_window((0, 0), window=self.container, anchor="nw")
-        self.container.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
+        self.search_entry.bind("<Return>", lambda e: self.search())
 
         self.search()
 
-    def search(self):
-        for w in self.container.winfo_children():
-            w.destroy()
-        q = self.search_entry.get().strip()
-        self.status.config(text="Loading shaders...")
-        threading.Thread(
-            target=self.fetch_shaders,
-            args=(q,),
-            daemon=True
-        ).start()
+    def schedule_search(self, event=None):
+        # Search as you type, once typing pauses
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(SEARCH_DEBOUNCE_MS, lambda: self.search(force=False))
 
-    def fetch_shaders(self, query):
-        params = {
-            "query": query,
-            "limit": 40,
-            "facets": '[["project_type:shader"]]'
-        }
-        try:
-            r = requests.get(SEARCH_URL, params=params, timeout=15)
-            r.raise_for_status()
-            shaders = r.json()["hits"]
-            self.root.after(0, lambda: self.render_shaders(shaders))
-            self.root.after(
-                0,
-                lambda: self.status.config(
-                    text=f"Found {len(shaders)} shaders"
-                )
-            )
-        except Exception as e:
-            self.root.after(
-                0,
-                lambda: self.status.config(text=f"Error: {e}")
-            )
-
-    def render_shaders(self, shaders):
-        cols = 4
-        row = col = 0
-        for shader in shaders:
-            card = self.create_card(self.container, shader)
-            card.grid(row=row, column=col, padx=14, pady=14)
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
-
-    def create_card(self, parent, shader):
-        card = tk.Frame(parent, bg="#1e1e1e", width=240, height=300)
-        card.pack_propagate(False)
-
-        icon_lbl = tk.Label(card, bg="#1e1e1e")
-        icon_lbl.pack(pady=10)
-
-        if shader.get("icon_url"):
-            threading.Thread(
-                target=self.load_icon,
-                args=(shader["icon_url"], icon_lbl, shader["project_id"]),
-                daemon=True
-            ).start()
-
-        tk.Label(
-            card,
-            text=shader.get("title", ""),
-            fg="white",
-            bg="#1e1e1e",
-            font=("Segoe UI", 11, "bold"),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(6, 2))
-
-        tk.Label(
-            card,
-            text=shader.get("description", ""),
-            fg="#bbb",
-            bg="#1e1e1e",
-            font=("Segoe UI", 9),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(0, 8))
+    def search(self, force=True):
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+        q = self.search_entry.get().strip()
+        if not force and q == self.last_query:
+            return
+        self.last_query = q
 
-        tk.Button(
-            card,
-            text="DOWNLOAD",
-            bg="#5865f2",
-            fg="white",
-            font=("Segoe UI", 10, "bold"),
-            command=lambda pid=shader["project_id"]: self.download(pid)
-        ).pack(pady=8, ipadx=14, ipady=4)
+        if self.pager:
+            self.pager.cancel()
+        self.generation += 1
+        gen = self.generation
+        self.grid.set_items([])
+        self.status.config(text="Loading shaders...")
+        on_items = lambda hits, first, gen=gen: gen == self.generation and self.show_shaders(hits, first)
+        on_error = lambda e, gen=gen: gen == self.generation and self.status.config(text=f"Error: {e}")
+        params = {"query": q, "facets": '[["project_type:shader"]]'}
+        if catalog_index.is_ready("shader"):
+            # Answered from the local index, kept fresh in the background;
+            # falls back to SEARCH_URL when the index has too few matches
+            self.pager = LocalSearchPager(self.root, q, {"project_type": "shader"}, on_items, on_error, SEARCH_URL, params)
+        else:
+            self.pager = SearchPager(self.root, SEARCH_URL, params, on_items, on_error)
+        catalog_index.refresh_async("shader")
+        self.pager.load_more()
 
-        return card
+    def load_more(self):
+        if self.pager:
+            self.pager.load_more()
 
-    def load_icon(self, url, label, pid):
-        try:
-            r = requests.get(url, timeout=10)
-            img = Image.open(io.BytesIO(r.content)).resize((96, 96))
-            tkimg = ImageTk.PhotoImage(img)
-            self.images[pid] = tkimg
-            self.root.after(0, lambda: label.config(image=tkimg))
-        except:
-            pass
+    def show_shaders(self, shaders, first_page=True):
+        if first_page:
+            self.grid.set_items(shaders)
+        else:
+            self.grid.append_items(shaders)
+        self.status.config(text=f"Found {self.pager.total} shaders")
 
     def download(self, project_id):
         self.status.config(text="Downloading shader...")
@@ -758,9 +714,7 @@ class ModrinthShaders:
 
     def download_thread(self, project_id):
         try:
-            r = requests.get(VERSION_URL.format(project_id), timeout=15)
-            r.raise_for_status()
-            versions = r.json()
+            versions = http_cache.get_json(VERSION_URL.format(project_id), timeout=15)
             if not versions:
                 self.root.after(
                     0,
@@ -769,18 +723,11 @@ class ModrinthShaders:
                     )
                 )
                 return
-            MC_DIR = os.path.join(os.getenv("APPDATA"), ".minecraft")
-            SHADERPACKS_DIR = os.path.join(MC_DIR, "shaderpacks")
-            os.makedirs(SHADERPACKS_DIR, exist_ok=True)
+            SHADERPACKS_DIR = instance_dir("shaderpacks")
 
 
             file = versions[0]["files"][0]
-            path = os.path.join(SHADERPACKS_DIR, file["filename"])
-            with requests.get(file["url"], stream=True) as d:
-                with open(path, "wb") as f:
-                    for c in d.iter_content(8192):
-                        if c:
-                            f.write(c)
+            mod_store.install(file, SHADERPACKS_DIR)
             self.root.after(
                 0,
                 lambda: self.status.config(
@@ -788,11 +735,10 @@ class ModrinthShaders:
                 )
             )
         except Exception as e:
+            message = f"Download error: {e}"
             self.root.after(
                 0,
-                lambda: self.status.config(
-                    text=f"Download error: {e}"
-                )
+                lambda: self.status.config(text=message)
             )
 
    
@@ -801,7 +747,6 @@ class ModrinthResourcePacks:
     def __init__(self, parent):
         self.root = parent
         self.root.configure(bg="#121212")
-        self.images = {}
 
         top = tk.Frame(self.root, bg="#121212")
         top.pack(fill="x", pady=12)
@@ -831,108 +776,60 @@ class ModrinthResourcePacks:
 
         scrollbar = tk.Scrollbar(self.root, command=self.canvas.yview)
         scrollbar.pack(side="right", fill="y")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.pager = None
+        self.generation = 0
+        self.search_job = None
+        self.last_query = None
+        self.grid = VirtualCardGrid(self.canvas, scrollbar, self.download, self.load_more)
 
-        self.container = tk.Frame(self.canvas, bg="#121212")
-        self.canvas.create_window((0, 0), window=self.container, anchor="nw")
-        self.container.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
+        self.search_entry.bind("<Return>", lambda e: self.search())
 
         self.search()
 
-    def search(self):
-        for w in self.container.winfo_children():
-            w.destroy()
-        q = self.search_entry.get().strip()
-        self.status.config(text="Loading resource packs...")
-        threading.Thread(
-            target=self.fetch_packs,
-            args=(q,),
-            daemon=True
-        ).start()
-
-    def fetch_packs(self, query):
-        params = {
-            "query": query,
-            "limit": 40,
-            "facets": '[["project_type:resourcepack"]]'
-        }
-        try:
-            r = requests.get(SEARCH_URL, params=params, timeout=15)
-            r.raise_for_status()
-            packs = r.json()["hits"]
-            self.root.after(0, lambda: self.render_packs(packs))
-            self.root.after(
-                0,
-                lambda: self.status.config(
-                    text=f"Found {len(packs)} resource packs"
-                )
-            )
-        except Exception as e:
-            self.root.after(
-                0,
-                lambda: self.status.config(text=f"Error: {e}")
-            )
-
-    def render_packs(self, packs):
-        cols = 4
-        row = col = 0
-        for pack in packs:
-            card = self.create_card(self.container, pack)
-            card.grid(row=row, column=col, padx=14, pady=14)
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
-
-    def create_card(self, parent, pack):
-        card = tk.Frame(parent, bg="#1e1e1e", width=240, height=300)
-        card.pack_propagate(False)
-
-        icon_lbl = tk.Label(card, bg="#1e1e1e")
-        icon_lbl.pack(pady=10)
-
-        if pack.get("icon_url"):
-            threading.Thread(
-                target=self.load_icon,
-                args=(pack["icon_url"], icon_lbl, pack["project_id"]),
-                daemon=True
-            ).start()
-
-        tk.Label(
-            card,
-            text=pack.get("title", ""),
-            fg="white",
-            bg="#1e1e1e",
-            font=("Segoe UI", 11, "bold"),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(6, 2))
-
-        tk.Label(
-            card,
-            text=pack.get("description", ""),
-            fg="#bbb",
-            bg="#1e1e1e",
-            font=("Segoe UI", 9),
-            wraplength=200,
-            justify="center"
-        ).pack(pady=(0, 8))
+    def schedule_search(self, event=None):
+        # Search as you type, once typing pauses
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(SEARCH_DEBOUNCE_MS, lambda: self.search(force=False))
 
-        tk.Button(
-            card,
-            text="DOWNLOAD",
-            bg="#5865f2",
-            fg="white",
-            font=("Segoe UI", 10, "bold"),
-            command=lambda pid=pack["project_id"]: self.download(pid)
-        ).pack(pady=8, ipadx=14, ipady=4)
+    def search(self, force=True):
+        if self.search_job:
+            self.root.after_cancel(self.search_job)
+            self.search_job = None
+        q = self.search_entry.get().strip()
+        if not force and q == self.last_query:
+            return
+        self.last_query = q
 
-        return card
+        if self.pager:
+            self.pager.cancel()
+        self.generation += 1
+        gen = self.generation
+        self.grid.set_items([])
+        self.status.config(text="Loading resource packs...")
+        on_items = lambda hits, first, gen=gen: gen == self.generation and self.show_packs(hits, first)
+        on_error = lambda e, gen=gen: gen == self.generation and self.status.config(text=f"Error: {e}")
+        params = {"query": q, "facets": '[["project_type:resourcepack"]]'}
+        if catalog_index.is_ready("resourcepack"):
+            # Answered from the local index, kept fresh in the background;
+            # falls back to SEARCH_URL when the index has too few matches
+            self.pager = LocalSearchPager(self.root, q, {"project_type": "resourcepack"}, on_items, on_error, SEARCH_URL, params)
+        else:
+            self.pager = SearchPager(self.root, SEARCH_URL, params, on_items, on_error)
+        catalog_index.refresh_async("resourcepack")
+        self.pager.load_more()
 
+    def load_more(self):
+        if self.pager:
+            self.pager.load_more()
 
+    def show_packs(self, packs, first_page=True):
+        if first_page:
+            self.grid.set_items(packs)
+        else:
+            self.grid.append_items(packs)
+        self.status.config(text=f"Found {self.pager.total} resource packs")
 
     def download(self, project_id):
         self.status.config(text="Downloading resource pack...")
@@ -944,9 +841,7 @@ class ModrinthResourcePacks:
 
     def download_thread(self, project_id):
         try:
-            r = requests.get(VERSION_URL.format(project_id), timeout=15)
-            r.raise_for_status()
-            versions = r.json()
+            versions = http_cache.get_json(VERSION_URL.format(project_id), timeout=15)
             if not versions:
                 self.root.after(
                     0,
@@ -954,28 +849,21 @@ class ModrinthResourcePacks:
                 )
                 return
 
-            MC_DIR = os.path.join(os.getenv("APPDATA"), ".minecraft")
-            RESOURCEPACKS_DIR = os.path.join(MC_DIR, "resourcepacks")
-            os.makedirs(RESOURCEPACKS_DIR, exist_ok=True)
+            RESOURCEPACKS_DIR = instance_dir("resourcepacks")
 
             file = versions[0]["files"][0]
             filename = file.get("filename") or file["url"].split("/")[-1]
-            path = os.path.join(RESOURCEPACKS_DIR, filename)
-
-            with requests.get(file["url"], stream=True) as d:
-                with open(path, "wb") as f:
-                    for c in d.iter_content(8192):
-                        if c:
-                            f.write(c)
+            mod_store.install(dict(file, filename=filename), RESOURCEPACKS_DIR)
 
             self.root.after(
                 0,
                 lambda: self.status.config(text="Resource pack downloaded")
             )
         except Exception as e:
+            message = f"Download error: {e}"
             self.root.after(
                 0,
-                lambda: self.status.config(text=f"Download error: {e}")
+                lambda: self.status.config(text=message)
             )
             
 
@@ -1005,20 +893,25 @@ icon_label.place(relx=0.5, rely=0.5, anchor="center")
 # Force splash to render immediately
 root.update()
 
-# Function to hide splash after 10s
+startup_stage("window")
+
+# The splash goes away as soon as the Home page is up, see finish_startup
 def hide_splash():
     splash.destroy()
-    # Continue loading the rest of the UI here if you want
-
-# Schedule splash removal
-root.after(30000, hide_splash)
 
 
 # ---------------- PAGE SWITCHER ----------------
 
 pages = {}
+page_factories = {}
+
+def register_page(name, factory):
+    # Pages are only built the first time they are shown
+    page_factories[name] = factory
 
 def show_page(name):
+    if name not in pages:
+        pages[name] = page_factories.pop(name)()
     for p in pages.values():
         p.pack_forget()
     pages[name].pack(fill="both", expand=True)
@@ -1063,6 +956,7 @@ load_icon2("installs", "icons/install.png")
 load_icon2("mods", "icons/mods.png")
 load_icon2("shaders", "icons/shader.png")
 load_icon2("packs", "icons/pack.png")
+startup_stage("icon load")
 
 nav_button("home", "home").pack(pady=8, fill="x")
 nav_button("skins", "skins").pack(pady=8, fill="x")
@@ -1132,217 +1026,272 @@ tk.Button(
 
 # ---------------- SKINS PAGE ----------------
 
-Skins = tk.Frame(main, bg="#0b0b12")
-pages["skins"] = Skins
+def build_skins_page():
+    Skins = tk.Frame(main, bg="#0b0b12")
 
-tk.Label(
-    Skins,
-    text="Skins",
-    fg="white",
-    bg="#0b0b12",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+    tk.Label(
+        Skins,
+        text="Skins",
+        fg="white",
+        bg="#0b0b12",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
+
+    skins_card = tk.Frame(Skins, bg="#141420")
+    skins_card.pack(fill="both", expand=True, padx=40, pady=30)
+
+    tk.Button(
+        skins_card,
+        text="Download Skin Mod",
+        font=("Segoe UI", 12, "bold"),
+        bg="#3ba55d",
+        fg="white",
+        activebackground="#2f8f4f",
+        relief="flat",
+        cursor="hand2",
+        width=22,
+        command=download_custom_skin_loader
+    ).pack(pady=6)
+
+    tk.Button(
+        skins_card,
+        text="Open Skin Page",
+        font=("Segoe UI", 12, "bold"),
+        bg="#5865f2",
+        fg="white",
+        activebackground="#4752c4",
+        relief="flat",
+        cursor="hand2",
+        width=22,
+        command=open_skins_page
+    ).pack(pady=6)
+    return Skins
 
-skins_card = tk.Frame(Skins, bg="#141420")
-skins_card.pack(fill="both", expand=True, padx=40, pady=30)
+register_page("skins", build_skins_page)
 
-tk.Button(
-    skins_card,
-    text="Download Skin Mod",
-    font=("Segoe UI", 12, "bold"),
-    bg="#3ba55d",
-    fg="white",
-    activebackground="#2f8f4f",
-    relief="flat",
-    cursor="hand2",
-    width=22,
-    command=download_custom_skin_loader
-).pack(pady=6)
+# ---------------- SETTINGS PAGE ----------------
 
-tk.Button(
-    skins_card,
-    text="Open Skin Page",
-    font=("Segoe UI", 12, "bold"),
-    bg="#5865f2",
-    fg="white",
-    activebackground="#4752c4",
-    relief="flat",
-    cursor="hand2",
-    width=22,
-    command=open_skins_page
-).pack(pady=6)
+def build_settings_page():
+    settings = tk.Frame(main, bg="#0b0b12")
 
-# ---------------- SETTINGS PAGE ----------------
+    tk.Label(
+        settings,
+        text="Settings",
+        fg="white",
+        bg="#0b0b12",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
 
-settings = tk.Frame(main, bg="#0b0b12")
-pages["settings"] = settings
+    settings_card = tk.Frame(settings, bg="#141420")
+    settings_card.pack(fill="both", expand=True, padx=40, pady=30)
 
-tk.Label(
-    settings,
-    text="Settings",
-    fg="white",
-    bg="#0b0b12",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+    tk.Label(settings_card, text="Instance", fg="white", bg="#121212",
+             font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
+    tk.Label(settings_card, text="Each instance has its own mods, config and saves",
+             fg="#aaa", bg="#141420", font=("Segoe UI", 11)).pack()
+    picker = styled_dropdown(settings_card, instances.list_instances(), "instance", on_select=select_instance)
+    picker.pack(pady=6, ipadx=220, ipady=6)
+
+    name_entry = tk.Entry(settings_card, font=("Segoe UI", 12), width=24)
+    name_entry.pack(pady=(12, 0))
 
-settings_card = tk.Frame(settings, bg="#141420")
-settings_card.pack(fill="both", expand=True, padx=40, pady=30)
+    def create_instance():
+        if not name_entry.get().strip():
+            return
+        name = instances.create(name_entry.get())
+        name_entry.delete(0, "end")
+        picker.set_values(instances.list_instances())
+        picker.var.set(name)
+        data["instance"] = name
+        save_data()
+        select_instance(name)
+
+    tk.Button(settings_card, text="CREATE INSTANCE", bg="#5865f2", fg="white",
+              font=("Segoe UI", 12, "bold"), width=22,
+              command=create_instance).pack(pady=12)
+    return settings
+
+def select_instance(name):
+    status.config(text=f"Instance: {name}")
+    mods_page = pages.get("mods")
+    if mods_page is not None:
+        mods_page.browser.refresh_installed(check_updates=True)
+
+register_page("settings", build_settings_page)
 
 
 # ---------------- SETTINGS PAGE ----------------
 
-installs = tk.Frame(main, bg="#0b0b12")
-pages["installs"] = installs
+def build_installs_page():
+    installs = tk.Frame(main, bg="#0b0b12")
 
-tk.Label(
-    installs,
-    text="Installs",
-    fg="white",
-    bg="#0b0b12",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
-
-installs_card = tk.Frame(installs, bg="#141420")
-installs_card.pack(fill="both", expand=True, padx=40, pady=30)
-
-tk.Label(installs_card, text="Download Vanilla Version", fg="white", bg="#121212",
-         font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
-vanilla_list = [v["id"] for v in minecraft_launcher_lib.utils.get_version_list() if v["type"]=="release"]
-vd = styled_dropdown(installs_card, vanilla_list, "download_version")
-vd.pack(pady=6, ipadx=220, ipady=6)
-tk.Button(installs_card, text="INSTALL", bg="#3ba55d", fg="white",
-          font=("Segoe UI", 12, "bold"), width=22,
-          command=lambda: run_script("thevdowntest.py")).pack(pady=12)
-tk.Label(installs_card, text="Download Fabric Version", fg="white", bg="#121212",
-         font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
-tk.Button(installs_card, text="INSTALL", bg="#5865f2", fg="white",
-          font=("Segoe UI", 12, "bold"), width=22,
-          command=lambda: run_script("fabric-installer-1.1.0 (3).exe")).pack(pady=12)
-tk.Label(installs_card, text="Fabric API Download", fg="white", bg="#121212",
-         font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
-fabric_api_versions = ["1.21.11","1.21.10","1.21.9","1.21.8"]
-fad = styled_dropdown(installs_card, fabric_api_versions, "FabricAPI_Version")
-fad.pack(pady=6, ipadx=220, ipady=6)
-tk.Button(installs_card, text="INSTALL", bg="#5865f2", fg="white",
-          font=("Segoe UI", 12, "bold"), width=22,
-          command=lambda: run_script("install_fabric_api.py")).pack(pady=12)
+    tk.Label(
+        installs,
+        text="Installs",
+        fg="white",
+        bg="#0b0b12",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
+
+    installs_card = tk.Frame(installs, bg="#141420")
+    installs_card.pack(fill="both", expand=True, padx=40, pady=30)
+
+    tk.Label(installs_card, text="Download Vanilla Version", fg="white", bg="#121212",
+             font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
+    vd = styled_dropdown(installs_card, [], "download_version")
+    vd.pack(pady=6, ipadx=220, ipady=6)
+    load_version_manifest(vd.set_values)
+    tk.Button(installs_card, text="INSTALL", bg="#3ba55d", fg="white",
+              font=("Segoe UI", 12, "bold"), width=22,
+              command=lambda: run_script("thevdowntest.py")).pack(pady=12)
+    tk.Label(installs_card, text="Download Fabric Version", fg="white", bg="#121212",
+             font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
+    tk.Button(installs_card, text="INSTALL", bg="#5865f2", fg="white",
+              font=("Segoe UI", 12, "bold"), width=22,
+              command=lambda: run_script("fabric-installer-1.1.0 (3).exe")).pack(pady=12)
+    tk.Label(installs_card, text="Fabric API Download", fg="white", bg="#121212",
+             font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
+    fabric_api_versions = ["1.21.11","1.21.10","1.21.9","1.21.8"]
+    fad = styled_dropdown(installs_card, fabric_api_versions, "FabricAPI_Version")
+    fad.pack(pady=6, ipadx=220, ipady=6)
+    tk.Button(installs_card, text="INSTALL", bg="#5865f2", fg="white",
+              font=("Segoe UI", 12, "bold"), width=22,
+              command=lambda: run_script("install_fabric_api.py")).pack(pady=12)
+    tk.Label(installs_card, text="Repair Assets", fg="white", bg="#121212",
+             font=("Segoe UI", 18, "bold")).pack(pady=(30, 8))
+    tk.Button(installs_card, text="VERIFY & REPAIR", bg="#d4861c", fg="white",
+              font=("Segoe UI", 12, "bold"), width=22,
+              command=lambda: run_script("asset_verifier.py")).pack(pady=12)
+    return installs
+
+register_page("installs", build_installs_page)
 
 # ---------------- SETTINGS PAGE ----------------
 
-extra_installs = tk.Frame(main, bg="#0b0b12")
-pages["extra_installs"] = extra_installs
+def build_extra_installs_page():
+    extra_installs = tk.Frame(main, bg="#0b0b12")
 
-tk.Label(
-    extra_installs,
-    text="Extra Installs",
-    fg="white",
-    bg="#0b0b12",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+    tk.Label(
+        extra_installs,
+        text="Extra Installs",
+        fg="white",
+        bg="#0b0b12",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
 
-extra_installs_card = tk.Frame(extra_installs, bg="#141420")
-extra_installs_card.pack(fill="both", expand=True, padx=40, pady=30)
+    extra_installs_card = tk.Frame(extra_installs, bg="#141420")
+    extra_installs_card.pack(fill="both", expand=True, padx=40, pady=30)
 
-tk.Label(
-    extra_installs_card,
-    text="Extra Installs",
-    fg="white",
-    bg="#121212",
-    font=("Segoe UI", 22, "bold")
-).pack(pady=(20, 14))
+    tk.Label(
+        extra_installs_card,
+        text="Extra Installs",
+        fg="white",
+        bg="#121212",
+        font=("Segoe UI", 22, "bold")
+    ).pack(pady=(20, 14))
 
 
-btn_frame = tk.Frame(extra_installs, bg="#121212")
-btn_frame.pack(pady=10)
+    btn_frame = tk.Frame(extra_installs, bg="#121212")
+    btn_frame.pack(pady=10)
 
 
-tk.Button(
-    extra_installs_card,
-    text="Download Skyblock",
-    font=("Segoe UI", 12, "bold"),
-    bg="#5865f2",
-    fg="white",
-    activebackground="#4752c4",
-    relief="flat",
-    cursor="hand2",
-    width=22,
-    command=download_skyblock
-).pack(pady=6)
+    tk.Button(
+        extra_installs_card,
+        text="Download Skyblock",
+        font=("Segoe UI", 12, "bold"),
+        bg="#5865f2",
+        fg="white",
+        activebackground="#4752c4",
+        relief="flat",
+        cursor="hand2",
+        width=22,
+        command=download_skyblock
+    ).pack(pady=6)
 
 
-tk.Button(
-    extra_installs_card,
-    text="Download Oneblock",
-    font=("Segoe UI", 12, "bold"),
-    bg="#3ba55d",
-    fg="white",
-    activebackground="#2f8f4f",
-    relief="flat",
-    cursor="hand2",
-    width=22,
-    command=download_oneblock
-).pack(pady=6)
+    tk.Button(
+        extra_installs_card,
+        text="Download Oneblock",
+        font=("Segoe UI", 12, "bold"),
+        bg="#3ba55d",
+        fg="white",
+        activebackground="#2f8f4f",
+        relief="flat",
+        cursor="hand2",
+        width=22,
+        command=download_oneblock
+    ).pack(pady=6)
+
+    tk.Button(
+        extra_installs_card,
+        text="Download Java 21",
+        font=("Segoe UI", 12, "bold"),
+        bg="#3ba55d",
+        fg="white",
+        activebackground="#2f8f4f",
+        relief="flat",
+        cursor="hand2",
+        width=22,
+        command=download_java21
+    ).pack(pady=6)
+    return extra_installs
 
-tk.Button(
-    extra_installs_card,
-    text="Download Java 21",
-    font=("Segoe UI", 12, "bold"),
-    bg="#3ba55d",
-    fg="white",
-    activebackground="#2f8f4f",
-    relief="flat",
-    cursor="hand2",
-    width=22,
-    command=download_java21
-).pack(pady=6)
+register_page("extra_installs", build_extra_installs_page)
 
 # ---------------- SETTINGS PAGE ----------------
 
-mods = tk.Frame(main, bg="#0b0b12")
-pages["mods"] = mods
+def build_mods_page():
+    mods = tk.Frame(main, bg="#0b0b12")
 
-tk.Label(
-    mods,
-    text="Mods",
-    fg="white",
-    bg="#0f0f18",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+    tk.Label(
+        mods,
+        text="Mods",
+        fg="white",
+        bg="#0f0f18",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
 
-ModrinthBrowser(mods)
+    mods.browser = ModrinthBrowser(mods)
+    return mods
+
+register_page("mods", build_mods_page)
 
 # ---------------- SETTINGS PAGE ----------------
 
-shaders = tk.Frame(main, bg="#0b0b12")
-pages["shaders"] = shaders
+def build_shaders_page():
+    shaders = tk.Frame(main, bg="#0b0b12")
 
-tk.Label(
-    shaders,
-    bg="#141420",
-    text="Shaders",
-    fg="white",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+    tk.Label(
+        shaders,
+        bg="#141420",
+        text="Shaders",
+        fg="white",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
 
-ModrinthShaders(shaders)
+    shaders.browser = ModrinthShaders(shaders)
+    return shaders
 
-# ---------------- SETTINGS PAGE ----------------
+register_page("shaders", build_shaders_page)
 
-packs = tk.Frame(main, bg="#0b0b12")
-pages["packs"] = packs
-
-tk.Label(
-    packs,
-    text="Packs",
-    bg="#0f0f18",
-    fg="white",
-    font=("Segoe UI", 28, "bold")
-).pack(anchor="w", padx=40, pady=(30, 10))
+# ---------------- SETTINGS PAGE ----------------
 
-ModrinthResourcePacks(packs)
+def build_packs_page():
+    packs = tk.Frame(main, bg="#0b0b12")
 
+    tk.Label(
+        packs,
+        text="Packs",
+        bg="#0f0f18",
+        fg="white",
+        font=("Segoe UI", 28, "bold")
+    ).pack(anchor="w", padx=40, pady=(30, 10))
 
+    packs.browser = ModrinthResourcePacks(packs)
+    return packs
 
+register_page("packs", build_packs_page)
+startup_stage("page registry")
 
 
 tk.Label(home, text="Username:", fg="white", font=("Segoe UI", 12),bg="#0f0f18").pack(side="left", padx=16)
@@ -1353,6 +1302,7 @@ username_entry.bind("<FocusOut>", update_username)
 
 vanilla_versions = get_vanilla_versions()
 fabric_versions = get_fabric_versions()
+startup_stage("version scan")
 vanilla_var = tk.StringVar(value=data.get("vanilla_version") or (vanilla_versions[0] if vanilla_versions else ""))
 fabric_var = tk.StringVar(value=data.get("fabric_version") or (fabric_versions[0] if fabric_versions else ""))
 
@@ -1371,4 +1321,13 @@ status.pack(side="right", padx=20)
 # ---------------- START ----------------
 
 show_page("home")
+startup_stage("home page")
+
+def finish_startup():
+    # Runs once the event loop is idle, i.e. Home has been drawn and takes input
+    hide_splash()
+    startup_stage("first frame")
+    write_startup_log()
+
+root.after_idle(finish_startup)
 root.mainloop()
@@ -1,9 +1,8 @@
 import os
 import sys
-import requests
 import zipfile
 import shutil
-from io import BytesIO
+import downloader
 
 # Current folder
 current_folder = os.path.dirname(os.path.abspath(__file__))
@@ -18,6 +17,19 @@ github_zip_url = "https://github.com/cringsimulator-a11y/TNTLauncher/archive/ref
 
 print("Starting update...")
 
+# Download ZIP before anything is deleted, so a failed download leaves the
+# current install working
+print("Downloading latest launcher files...")
+zip_path = os.path.join(current_folder, "TEMP", "update.zip")
+downloader.download(github_zip_url, zip_path, timeout=60)
+try:
+    with zipfile.ZipFile(zip_path) as zf:
+        if zf.testzip() is not None:
+            raise zipfile.BadZipFile("CRC error")
+except zipfile.BadZipFile:
+    os.remove(zip_path)
+    raise SystemExit("Downloaded update is corrupt, run the update again")
+
 # Delete old files except folders and launcher_data.json and temp.py itself
 for item in os.listdir(current_folder):
     item_path = os.path.join(current_folder, item)
@@ -28,14 +40,8 @@ for item in os.listdir(current_folder):
     else:
         os.remove(item_path)
 
-# Download ZIP
-print("Downloading latest launcher files...")
-r = requests.get(github_zip_url, stream=True, timeout=60)
-r.raise_for_status()
-zip_bytes = BytesIO(r.content)
-
 # Extract files
-with zipfile.ZipFile(zip_bytes) as zf:
+with zipfile.ZipFile(zip_path) as zf:
     root_folder_in_zip = zf.namelist()[0].split('/')[0]  # usually Repo-main/
     for member in zf.namelist():
         if member.endswith('/'):
@@ -47,10 +53,9 @@ with zipfile.ZipFile(zip_bytes) as zf:
         if rel_path in ("launcher_data.json", "temp.py"):
             continue
 
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        with open(target_path, "wb") as f:
-            f.write(zf.read(member))
+        downloader.write_file(target_path, zf.read(member))
 
+os.remove(zip_path)
 print("Update complete!")
 
 # Self-delete
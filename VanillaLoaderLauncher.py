@@ -1,7 +1,11 @@
 import json
 import os
 import subprocess
-import minecraft_launcher_lib
+import version_installer
+import library_verifier
+import instances
+import launch_args
+import natives
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 data_file = os.path.join(base_dir, "launcher_data.json")
@@ -19,36 +23,25 @@ data = load_data()
 
 version = data.get("vanilla_version", "1.21.1")
 username = data.get("username", "Player")
+game_dir = instances.game_dir(instances.selected(data))
+os.makedirs(game_dir, exist_ok=True)
 
 version_dir = os.path.join(mc, "versions", version)
 
 if not os.path.exists(version_dir):
-    minecraft_launcher_lib.install.install_minecraft_version(version, mc)
+    version_installer.install_version(version, mc)
+elif data.get("verify_libraries", True):
+    library_verifier.verify(mc, version)
 
-version_json = json.load(open(os.path.join(version_dir, f"{version}.json"), "r", encoding="utf-8"))
+template = launch_args.get_template(mc, version)
+classpath = launch_args.join_classpath(template["classpath"])
+natives.unpack_natives(template["natives_jars"], template["natives_directory"])
 
-libs = []
-for lib in version_json["libraries"]:
-    if "downloads" in lib and "artifact" in lib["downloads"]:
-        libs.append(os.path.join(mc, "libraries", lib["downloads"]["artifact"]["path"]))
-
-libs.append(os.path.join(version_dir, f"{version}.jar"))
-classpath = ";".join(libs)
-
-cmd = [
+cmd = launch_args.command(
     "java",
-    "-Xmx2G",
-    "-Djava.library.path=" + os.path.join(version_dir, "natives"),
-    "-cp", classpath,
-    version_json["mainClass"],
-    "--username", username,
-    "--version", version,
-    "--gameDir", mc,
-    "--assetsDir", os.path.join(mc, "assets"),
-    "--assetIndex", version_json["assetIndex"]["id"],
-    "--uuid", "0",
-    "--accessToken", "0",
-    "--userType", "legacy"
-]
+    template,
+    launch_args.launch_values(username, game_dir, classpath),
+    ["-Xmx2G"]
+)
 
 subprocess.Popen(cmd)
@@ -0,0 +1,132 @@
+import os
+import sys
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import downloader
+import game_store
+import version_graph
+import instances
+
+# Verifies assets/objects against an asset index and repairs broken objects.
+# Every object is checked for size and sha1 in a thread pool; objects that
+# pass are stamped with their (size, mtime) in
+# assets/indexes/<id>.verified.json, so the next run only hashes objects that
+# changed since. Repair deletes a broken object (and its store copy, if they
+# are the same file) and fetches it again through game_store.
+#
+#   python asset_verifier.py [version or index id] [--check-only]
+
+WORKERS = 8
+
+
+def stamp_path(mc_dir, index_id):
+    return os.path.join(mc_dir, "assets", "indexes", f"{index_id}.verified.json")
+
+
+def load_stamps(mc_dir, index_id):
+    data = game_store.read_json(stamp_path(mc_dir, index_id)) or {}
+    return data.get("objects", {})
+
+
+def save_stamps(mc_dir, index_id, stamps):
+    path = stamp_path(mc_dir, index_id)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"verified_at": time.time(), "objects": stamps}, f)
+    os.replace(tmp, path)
+
+
+def index_for(mc_dir, version_or_index):
+    """
+    Asset index id for a version id (following inheritsFrom), or the id itself
+    """
+    try:
+        version_data = version_graph.resolve(mc_dir, version_or_index)
+    except (OSError, ValueError):
+        return version_or_index
+    return (version_data.get("assetIndex") or {}).get("id") or version_or_index
+
+
+def check_object(sha1, size, path, stamp):
+    """
+    Return the new stamp for a good object, or None if it is missing or broken
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if size is not None and st.st_size != size:
+        return None
+    current = [st.st_size, st.st_mtime_ns]
+    if stamp == current:
+        return current
+    if downloader.file_sha1(path) != sha1:
+        return None
+    return current
+
+
+def verify(mc_dir, index_id, repair=True, workers=WORKERS, progress=None):
+    """
+    Check every object of an asset index. Returns (checked, broken, repaired).
+    progress(done, total) is called from worker threads.
+    """
+    entries = list(game_store.asset_files(mc_dir, index_id))
+    if not entries:
+        raise FileNotFoundError(f"Asset index {index_id} is not installed")
+    stamps = load_stamps(mc_dir, index_id)
+    done = [0]
+    lock = threading.Lock()
+
+    def check(entry):
+        sha1, size, _, path = entry
+        result = check_object(sha1, size, path, stamps.get(sha1))
+        with lock:
+            done[0] += 1
+            if progress:
+                progress(done[0], len(entries))
+        return entry, result
+
+    broken = []
+    fresh = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for entry, result in pool.map(check, entries):
+            if result is None:
+                broken.append(entry)
+            else:
+                fresh[entry[0]] = result
+
+    repaired = 0
+    if repair and broken:
+        def fix(entry):
+            game_store.repair(*entry)
+            st = os.stat(entry[3])
+            return entry[0], [st.st_size, st.st_mtime_ns]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for sha1, stamp in pool.map(fix, broken):
+                fresh[sha1] = stamp
+                repaired += 1
+
+    save_stamps(mc_dir, index_id, fresh)
+    return len(entries), len(broken), repaired
+
+
+def selected_version():
+    try:
+        with open(instances.DATA_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    return data.get("fabric_version") or data.get("vanilla_version")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    target = args[0] if args else selected_version()
+    if not target:
+        raise SystemExit("usage: asset_verifier.py [version or index id] [--check-only]")
+    index_id = index_for(instances.MC_DIR, target)
+    checked, broken, repaired = verify(instances.MC_DIR, index_id, repair="--check-only" not in sys.argv)
+    print(f"Asset index {index_id}: {checked} objects, {broken} broken, {repaired} repaired")
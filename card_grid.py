@@ -0,0 +1,170 @@
+import tkinter as tk
+import icon_service
+
+# Virtualized result grid for the Modrinth pages.
+# Only the rows inside the canvas viewport (plus one row either side) have
+# card widgets; scrolling re-binds those cards to other results instead of
+# creating and destroying widgets, so the result count no longer matters.
+
+CARD_WIDTH = 240
+CARD_HEIGHT = 300
+PAD = 14
+CELL_WIDTH = CARD_WIDTH + 2 * PAD
+CELL_HEIGHT = CARD_HEIGHT + 2 * PAD
+OVERSCAN_ROWS = 1
+NEAR_END_ROWS = 2  # ask for more results this many rows before the end
+HIDDEN = -10000
+
+# button text/colour for the states a card_state callback may return
+BUTTON_STATES = {
+    None: ("DOWNLOAD", "#5865f2"),
+    "installed": ("INSTALLED", "#3ba55d"),
+    "update": ("UPDATE", "#d4861c"),
+}
+
+
+class Card:
+    def __init__(self, canvas, on_download):
+        self.canvas = canvas
+        self.on_download = on_download
+        self.icon_url = None
+
+        self.frame = tk.Frame(canvas, bg="#1e1e1e", width=CARD_WIDTH, height=CARD_HEIGHT)
+        self.frame.pack_propagate(False)
+
+        self.icon = tk.Label(self.frame, bg="#1e1e1e")
+        self.icon.pack(pady=10)
+
+        self.title = tk.Label(
+            self.frame,
+            fg="white",
+            bg="#1e1e1e",
+            font=("Segoe UI", 11, "bold"),
+            wraplength=200,
+            justify="center"
+        )
+        self.title.pack(pady=(6, 2))
+
+        self.description = tk.Label(
+            self.frame,
+            fg="#bbb",
+            bg="#1e1e1e",
+            font=("Segoe UI", 9),
+            wraplength=200,
+            justify="center"
+        )
+        self.description.pack(pady=(0, 8))
+
+        self.button = tk.Button(
+            self.frame,
+            text="DOWNLOAD",
+            bg="#5865f2",
+            fg="white",
+            font=("Segoe UI", 10, "bold")
+        )
+        self.button.pack(pady=8, ipadx=14, ipady=4)
+
+        self.window = canvas.create_window(HIDDEN, HIDDEN, window=self.frame, anchor="nw")
+
+    def show(self, item, x, y, state=None):
+        self.canvas.coords(self.window, x, y)
+        self.title.config(text=item.get("title", ""))
+        self.description.config(text=item.get("description", ""))
+        text, color = BUTTON_STATES.get(state, BUTTON_STATES[None])
+        self.button.config(
+            text=text,
+            bg=color,
+            command=lambda pid=item["project_id"]: self.on_download(pid)
+        )
+
+        url = item.get("icon_url")
+        if url != self.icon_url:
+            self.icon_url = url
+            self.icon.config(image="")
+            self.icon.image = None
+            if url:
+                icon_service.load(url, self.icon, lambda photo, url=url: self.set_icon(url, photo))
+
+    def set_icon(self, url, photo):
+        # The card may have been recycled for another result meanwhile
+        if url == self.icon_url and self.icon.winfo_exists():
+            self.icon.config(image=photo)
+            self.icon.image = photo
+
+    def hide(self):
+        self.canvas.coords(self.window, HIDDEN, HIDDEN)
+
+
+class VirtualCardGrid:
+    def __init__(self, canvas, scrollbar, on_download, on_near_end=None, card_state=None, cols=4):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.on_download = on_download
+        self.on_near_end = on_near_end
+        self.card_state = card_state  # card_state(item) -> key of BUTTON_STATES
+        self.cols = cols
+        self.items = []
+        self.visible = {}  # item index -> Card
+        self.spare = []
+
+        canvas.configure(yscrollcommand=self.on_scroll)
+        canvas.bind("<Configure>", lambda e: self.refresh())
+
+    def set_items(self, items):
+        self.items = list(items)
+        for card in self.visible.values():
+            card.hide()
+            self.spare.append(card)
+        self.visible = {}
+        self.update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def append_items(self, items):
+        self.items.extend(items)
+        self.update_scrollregion()
+        self.refresh()
+
+    def redraw(self):
+        # Re-bind the visible cards, e.g. after the installed state changed
+        for index, card in self.visible.items():
+            self.place(card, index)
+
+    def place(self, card, index):
+        row, col = divmod(index, self.cols)
+        item = self.items[index]
+        state = self.card_state(item) if self.card_state else None
+        card.show(item, col * CELL_WIDTH + PAD, row * CELL_HEIGHT + PAD, state)
+
+    def update_scrollregion(self):
+        rows = -(-len(self.items) // self.cols)
+        self.canvas.configure(scrollregion=(0, 0, self.cols * CELL_WIDTH, rows * CELL_HEIGHT))
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        first_row = max(0, int(top // CELL_HEIGHT) - OVERSCAN_ROWS)
+        last_row = int((top + height) // CELL_HEIGHT) + OVERSCAN_ROWS
+        return first_row * self.cols, min(len(self.items), (last_row + 1) * self.cols)
+
+    def refresh(self):
+        start, end = self.visible_range()
+
+        for index in [i for i in self.visible if i < start or i >= end]:
+            card = self.visible.pop(index)
+            card.hide()
+            self.spare.append(card)
+
+        for index in range(start, end):
+            if index in self.visible:
+                continue
+            card = self.spare.pop() if self.spare else Card(self.canvas, self.on_download)
+            self.place(card, index)
+            self.visible[index] = card
+
+        if self.on_near_end and end >= len(self.items) - NEAR_END_ROWS * self.cols:
+            self.on_near_end()
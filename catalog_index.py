@@ -0,0 +1,265 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import threading
+import downloader
+from paths import CACHE_DIR
+
+# Local full-text index of the Modrinth catalog (Cache/catalog.db).
+# It is seeded from bulk search pages (most downloaded first), kept fresh by
+# walking "recently updated" pages until the last sync point, and also picks
+# up every hit the online search returns. Searches then run locally with
+# SQLite FTS5, falling back to LIKE on builds without FTS5.
+
+DB_PATH = os.path.join(CACHE_DIR, "catalog.db")
+SEARCH_URL = "https://api.modrinth.com/v2/search"
+
+BULK_PAGE_SIZE = 100
+SEED_PAGES = 30           # first fill: top 3000 projects per type
+UPDATE_PAGES = 20         # incremental refresh never walks further than this
+REFRESH_INTERVAL = 6 * 60 * 60
+
+_write_lock = threading.Lock()
+_refreshing = set()
+_fts = None
+_schema_ready = False
+
+
+def connect():
+    global _schema_ready
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    if not _schema_ready:
+        init_schema(conn)
+        _schema_ready = True
+    return conn
+
+
+def has_fts(conn):
+    global _fts
+    if _fts is None:
+        try:
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS fts_probe USING fts5(x)")
+            conn.execute("DROP TABLE fts_probe")
+            _fts = True
+        except sqlite3.OperationalError:
+            _fts = False
+    return _fts
+
+
+def init_schema(conn):
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS projects (
+            project_id TEXT PRIMARY KEY,
+            project_type TEXT,
+            title TEXT,
+            description TEXT,
+            categories TEXT,
+            versions TEXT,
+            downloads INTEGER,
+            date_modified TEXT,
+            hit TEXT
+        );
+        CREATE INDEX IF NOT EXISTS projects_type ON projects(project_type, downloads);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """)
+    if has_fts(conn):
+        conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+                title, description, categories, content='projects', content_rowid='rowid'
+            );
+            CREATE TRIGGER IF NOT EXISTS projects_ai AFTER INSERT ON projects BEGIN
+                INSERT INTO projects_fts(rowid, title, description, categories)
+                VALUES (new.rowid, new.title, new.description, new.categories);
+            END;
+            CREATE TRIGGER IF NOT EXISTS projects_ad AFTER DELETE ON projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, title, description, categories)
+                VALUES ('delete', old.rowid, old.title, old.description, old.categories);
+            END;
+            CREATE TRIGGER IF NOT EXISTS projects_au AFTER UPDATE ON projects BEGIN
+                INSERT INTO projects_fts(projects_fts, rowid, title, description, categories)
+                VALUES ('delete', old.rowid, old.title, old.description, old.categories);
+                INSERT INTO projects_fts(rowid, title, description, categories)
+                VALUES (new.rowid, new.title, new.description, new.categories);
+            END;
+        """)
+
+
+def padded(values):
+    # " a b c " so a single LIKE '% b %' matches whole words only
+    return " " + " ".join(values or []) + " "
+
+
+def add_hits(hits):
+    rows = [
+        (
+            h["project_id"],
+            h.get("project_type"),
+            h.get("title", ""),
+            h.get("description", ""),
+            padded(h.get("categories")),
+            padded(h.get("versions")),
+            h.get("downloads", 0),
+            h.get("date_modified", ""),
+            json.dumps(h)
+        )
+        for h in hits if h.get("project_id")
+    ]
+    if not rows:
+        return
+    with _write_lock:
+        conn = connect()
+        try:
+            with conn:
+                conn.executemany("""
+                    INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(project_id) DO UPDATE SET
+                        project_type = excluded.project_type,
+                        title = excluded.title,
+                        description = excluded.description,
+                        categories = excluded.categories,
+                        versions = excluded.versions,
+                        downloads = excluded.downloads,
+                        date_modified = excluded.date_modified,
+                        hit = excluded.hit
+                """, rows)
+        finally:
+            conn.close()
+
+
+def get_meta(conn, key, default=None):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row["value"] if row else default
+
+
+def set_meta(key, value):
+    with _write_lock:
+        conn = connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(value)))
+        finally:
+            conn.close()
+
+
+def is_ready(project_type):
+    """
+    True once the bulk seed for project_type has finished
+    """
+    conn = connect()
+    try:
+        return get_meta(conn, f"seeded:{project_type}") is not None
+    finally:
+        conn.close()
+
+
+def fts_query(text):
+    words = re.findall(r"\w+", text.lower())
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def search(text, project_type, categories=None, game_version=None, limit=40, offset=0):
+    """
+    Search the local index; returns a dict shaped like Modrinth's search response
+    """
+    where = ["p.project_type = ?"]
+    args = [project_type]
+    for cat in categories or []:
+        where.append("p.categories LIKE ?")
+        args.append(f"% {cat} %")
+    if game_version:
+        where.append("p.versions LIKE ?")
+        args.append(f"% {game_version} %")
+
+    conn = connect()
+    try:
+        match = fts_query(text)
+        if match and has_fts(conn):
+            base = "FROM projects_fts JOIN projects p ON p.rowid = projects_fts.rowid " \
+                   "WHERE projects_fts MATCH ? AND " + " AND ".join(where)
+            base_args = [match] + args
+            order = "ORDER BY bm25(projects_fts, 10.0, 1.0, 2.0), p.downloads DESC"
+        elif match:
+            like = [f"%{w}%" for w in match.replace('"', "").replace("*", "").split()]
+            base = "FROM projects p WHERE " + " AND ".join(
+                where + ["(p.title LIKE ? OR p.description LIKE ?)"] * len(like)
+            )
+            base_args = args + [x for w in like for x in (w, w)]
+            order = "ORDER BY p.downloads DESC"
+        else:
+            base = "FROM projects p WHERE " + " AND ".join(where)
+            base_args = args
+            order = "ORDER BY p.downloads DESC"
+
+        total = conn.execute("SELECT COUNT(*) " + base, base_args).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT p.hit {base} {order} LIMIT ? OFFSET ?", base_args + [limit, offset]
+        ).fetchall()
+        return {"hits": [json.loads(r["hit"]) for r in rows], "total_hits": total, "offset": offset}
+    finally:
+        conn.close()
+
+
+def fetch_page(project_type, index, offset):
+    return downloader.fetch_json(SEARCH_URL, {
+        "facets": json.dumps([[f"project_type:{project_type}"]]),
+        "index": index,
+        "limit": BULK_PAGE_SIZE,
+        "offset": offset
+    }, timeout=30)
+
+
+def refresh(project_type):
+    """
+    Seed the index for project_type, or pull in what changed since the last sync
+    """
+    conn = connect()
+    try:
+        seeded = get_meta(conn, f"seeded:{project_type}") is not None
+        last_sync = get_meta(conn, f"synced:{project_type}", "")
+        last_run = float(get_meta(conn, f"refreshed:{project_type}", 0))
+    finally:
+        conn.close()
+
+    if seeded and time.time() - last_run < REFRESH_INTERVAL:
+        return
+
+    newest = last_sync
+    if not seeded:
+        for page in range(SEED_PAGES):
+            result = fetch_page(project_type, "downloads", page * BULK_PAGE_SIZE)
+            add_hits(result["hits"])
+            newest = max([newest] + [h.get("date_modified", "") for h in result["hits"]])
+            if len(result["hits"]) < BULK_PAGE_SIZE:
+                break
+        set_meta(f"seeded:{project_type}", time.time())
+    else:
+        for page in range(UPDATE_PAGES):
+            hits = fetch_page(project_type, "updated", page * BULK_PAGE_SIZE)["hits"]
+            changed = [h for h in hits if h.get("date_modified", "") > last_sync]
+            add_hits(changed)
+            newest = max([newest] + [h.get("date_modified", "") for h in changed])
+            if len(changed) < len(hits) or len(hits) < BULK_PAGE_SIZE:
+                break
+
+    set_meta(f"synced:{project_type}", newest)
+    set_meta(f"refreshed:{project_type}", time.time())
+
+
+def refresh_async(project_type):
+    if project_type in _refreshing:
+        return
+    _refreshing.add(project_type)
+
+    def worker():
+        try:
+            refresh(project_type)
+        except Exception as e:
+            print(f"Catalog refresh for {project_type} failed: {e}")
+        finally:
+            _refreshing.discard(project_type)
+
+    threading.Thread(target=worker, daemon=True).start()
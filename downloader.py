@@ -0,0 +1,246 @@
+import os
+import json
+import hashlib
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Shared download engine for everything that pulls files from Modrinth.
+# One pooled session is reused for API calls and file transfers, big files are
+# fetched as parallel HTTP range segments, and unfinished downloads are kept as
+# <file>.part (plus <file>.part.json for segmented ones) so a retry resumes.
+# Nothing is ever written to the final path directly: a file only appears
+# there, via an atomic rename, once its size and hashes check out and it has
+# been flushed to disk.
+
+USER_AGENT = "cringsimulator-a11y/TNTLauncher"
+
+BUFFER_SIZE = 1024 * 1024          # write buffer and read chunk size
+SEGMENT_THRESHOLD = 8 * 1024 * 1024  # files at least this big are split
+SEGMENT_COUNT = 4
+POOL_SIZE = 16
+# Sizes and Range offsets are counted in bytes on disk, so files are always
+# asked for without content encoding (requests would otherwise send gzip and
+# decode it, leaving the counts out of step with Content-Length)
+IDENTITY = {"Accept-Encoding": "identity"}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=3)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            s.headers["User-Agent"] = USER_AGENT
+            _session = s
+        return _session
+
+
+def fetch_json(url, params=None, timeout=20):
+    r = get_session().get(url, params=params, timeout=timeout)
+    r.raise_for_status()
+    return r.json()
+
+
+def probe(url, timeout=20):
+    """
+    Return (size, supports_ranges) for url, or (None, False) if unknown
+    """
+    try:
+        r = get_session().head(url, allow_redirects=True, headers=IDENTITY, timeout=timeout)
+        r.raise_for_status()
+    except requests.RequestException:
+        return None, False
+    size = r.headers.get("Content-Length")
+    ranges = r.headers.get("Accept-Ranges", "").lower() == "bytes"
+    return (int(size) if size and size.isdigit() else None), ranges
+
+
+class HashMismatch(Exception):
+    pass
+
+
+class SizeMismatch(Exception):
+    pass
+
+
+def fsync_file(path):
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def write_file(path, data):
+    """
+    Atomically replace path with data (bytes)
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    part = path + ".part"
+    with open(part, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(part, path)
+    return path
+
+
+def new_hashers(hashes):
+    # Only algorithms hashlib knows, e.g. Modrinth's {"sha1": ..., "sha512": ...}
+    return {name: hashlib.new(name) for name in (hashes or {}) if name in hashlib.algorithms_available}
+
+
+def hash_file(path, hashers):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(BUFFER_SIZE), b""):
+            for h in hashers.values():
+                h.update(chunk)
+
+
+def file_sha1(path):
+    hashers = new_hashers({"sha1": None})
+    hash_file(path, hashers)
+    return hashers["sha1"].hexdigest()
+
+
+def check_hashes(hashers, hashes, url):
+    for name, h in hashers.items():
+        if h.hexdigest() != hashes[name].lower():
+            raise HashMismatch(f"{name} mismatch for {url}")
+
+
+def download(url, path, progress=None, timeout=60, hashes=None, size=None):
+    """
+    Download url to path, resuming from path + ".part" when possible.
+    progress(done, total) is called from the worker thread(s).
+    size and hashes ({"sha1": hex, ...}) are checked before the file is moved
+    into place; when size is not given the server's Content-Length is used.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    part = path + ".part"
+    if size and size < SEGMENT_THRESHOLD:
+        # Small file of known size: no HEAD round trip, just try to resume;
+        # download_stream starts over if the server ignores the Range
+        ranges = True
+    else:
+        probed, ranges = probe(url)
+        size = size or probed
+    hashers = new_hashers(hashes)
+
+    if size and ranges and size >= SEGMENT_THRESHOLD:
+        download_segmented(url, part, size, progress, timeout)
+        hash_file(part, hashers)
+    else:
+        download_stream(url, part, size, ranges, progress, timeout, hashers)
+
+    actual = os.path.getsize(part)
+    if size and actual != size:
+        if actual > size:
+            os.remove(part)
+        # A short .part is kept so the next attempt resumes from it
+        raise SizeMismatch(f"Expected {size} bytes from {url}, got {actual}")
+    try:
+        check_hashes(hashers, hashes, url)
+    except HashMismatch:
+        os.remove(part)
+        raise
+    fsync_file(part)
+    os.replace(part, path)
+    return path
+
+
+def download_stream(url, part, size, ranges, progress, timeout, hashers=None):
+    hashers = hashers or {}
+    done = os.path.getsize(part) if ranges and os.path.exists(part) else 0
+    if size is not None and done > size:
+        done = 0
+    if done and done == size:
+        hash_file(part, hashers)
+        return
+    headers = dict(IDENTITY, Range=f"bytes={done}-") if done else IDENTITY
+
+    with get_session().get(url, stream=True, headers=headers, timeout=timeout) as r:
+        r.raise_for_status()
+        if done and r.status_code != 206:
+            done = 0
+        if done:
+            # Resuming: the bytes already on disk are part of the digest too
+            hash_file(part, hashers)
+        total = size or (done + int(r.headers.get("Content-Length", 0))) or None
+        with open(part, "ab" if done else "wb", buffering=BUFFER_SIZE) as f:
+            for chunk in r.iter_content(BUFFER_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    for h in hashers.values():
+                        h.update(chunk)
+                    done += len(chunk)
+                    if progress:
+                        progress(done, total)
+
+
+def load_segments(state_path, size):
+    if os.path.exists(state_path):
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("size") == size:
+                return state["segments"]
+        except (OSError, ValueError, KeyError):
+            pass
+    step = -(-size // SEGMENT_COUNT)
+    return [[start, min(start + step, size), 0] for start in range(0, size, step)]
+
+
+def download_segmented(url, part, size, progress, timeout):
+    state_path = part + ".json"
+    segments = load_segments(state_path, size)
+    lock = threading.Lock()
+
+    fresh = not os.path.exists(part) or os.path.getsize(part) != size
+    if fresh:
+        with open(part, "wb") as f:
+            f.truncate(size)
+        for seg in segments:
+            seg[2] = 0
+
+    def save_state():
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump({"size": size, "segments": segments}, f)
+
+    def fetch(seg):
+        start, end, _ = seg
+        if start + seg[2] >= end:
+            return
+        headers = dict(IDENTITY, Range=f"bytes={start + seg[2]}-{end - 1}")
+        with get_session().get(url, stream=True, headers=headers, timeout=timeout) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise RuntimeError(f"Server ignored range request for {url}")
+            with open(part, "r+b", buffering=BUFFER_SIZE) as f:
+                f.seek(start + seg[2])
+                for chunk in r.iter_content(BUFFER_SIZE):
+                    if not chunk:
+                        continue
+                    chunk = chunk[:end - start - seg[2]]
+                    f.write(chunk)
+                    f.flush()
+                    with lock:
+                        seg[2] += len(chunk)
+                        save_state()
+                        if progress:
+                            progress(sum(s[2] for s in segments), size)
+                    if start + seg[2] >= end:
+                        break
+
+    with ThreadPoolExecutor(max_workers=SEGMENT_COUNT) as pool:
+        for fut in [pool.submit(fetch, seg) for seg in segments]:
+            fut.result()
+
+    if sum(s[2] for s in segments) != size:
+        raise RuntimeError(f"Incomplete download: {url}")
+    if os.path.exists(state_path):
+        os.remove(state_path)
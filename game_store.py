@@ -0,0 +1,266 @@
+import os
+import sys
+import json
+from concurrent.futures import ThreadPoolExecutor
+import downloader
+import mod_store
+import instances
+import version_graph
+
+# Content-addressed store for game files: client jars, libraries, asset indexes
+# and asset objects, keyed by the sha1 Mojang publishes for each of them.
+# Every .minecraft root (or instance root) hardlinks its files from here, so a
+# library used by ten versions in three roots is on disk once, and a file that
+# gets deleted from a root is relinked instead of downloaded again.
+# The store sits next to .minecraft because hardlinks cannot cross drives.
+#
+#   python game_store.py import [mc_dir ...]   adopt what is already installed
+#   python game_store.py gc [--dry-run]        drop objects no version uses
+
+STORE_DIR = os.path.join(os.path.dirname(instances.MC_DIR), ".tntlauncher-store")
+ROOTS_FILE = os.path.join(STORE_DIR, "roots.json")
+ASSET_URL = "https://resources.download.minecraft.net"
+WORKERS = 8
+
+
+def blob_path(sha1):
+    sha1 = sha1.lower()
+    return os.path.join(STORE_DIR, sha1[:2], sha1)
+
+
+def load_roots():
+    try:
+        with open(ROOTS_FILE, "r", encoding="utf-8") as f:
+            roots = json.load(f)
+    except (OSError, ValueError):
+        roots = []
+    return list(dict.fromkeys([os.path.abspath(instances.MC_DIR)] + roots))
+
+
+def add_root(mc_dir):
+    roots = load_roots()
+    mc_dir = os.path.abspath(mc_dir)
+    if mc_dir in roots:
+        return
+    os.makedirs(STORE_DIR, exist_ok=True)
+    tmp = ROOTS_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(roots + [mc_dir], f, indent=2)
+    os.replace(tmp, ROOTS_FILE)
+
+
+# ---------- What a version needs ----------
+
+def read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def version_files(mc_dir, version_data):
+    """
+    Yield (sha1, size, url, path) for the client jar, libraries and asset index
+    of a resolved version, natives for every OS included
+    """
+    yield from version_graph.version_entries(mc_dir, version_data, all_os=True)
+    index = version_data.get("assetIndex")
+    if index and index.get("sha1"):
+        yield index["sha1"], index.get("size"), index.get("url"), \
+            os.path.join(mc_dir, "assets", "indexes", f"{index['id']}.json")
+
+
+def asset_files(mc_dir, index_id):
+    """
+    Yield (sha1, size, url, path) for every object in an asset index
+    """
+    index = read_json(os.path.join(mc_dir, "assets", "indexes", f"{index_id}.json")) or {}
+    seen = set()
+    for obj in index.get("objects", {}).values():
+        sha1 = obj["hash"]
+        if sha1 in seen:
+            continue
+        seen.add(sha1)
+        yield sha1, obj.get("size"), f"{ASSET_URL}/{sha1[:2]}/{sha1}", \
+            os.path.join(mc_dir, "assets", "objects", sha1[:2], sha1)
+
+
+def version_tree_files(mc_dir, version_id):
+    """
+    Everything a version (merged with its parents) needs, assets included
+    """
+    try:
+        version_data = version_graph.resolve(mc_dir, version_id, partial=True)
+    except (OSError, ValueError):
+        return []
+    files = {}
+    for entry in version_files(mc_dir, version_data):
+        files.setdefault(entry[3], entry)
+    if version_data.get("assetIndex"):
+        for entry in asset_files(mc_dir, version_data["assetIndex"]["id"]):
+            files.setdefault(entry[3], entry)
+    return list(files.values())
+
+
+def installed_versions(mc_dir):
+    versions_dir = os.path.join(mc_dir, "versions")
+    if not os.path.isdir(versions_dir):
+        return []
+    return [e.name for e in os.scandir(versions_dir)
+            if e.is_dir() and os.path.exists(os.path.join(e.path, f"{e.name}.json"))]
+
+
+def root_files(mc_dir):
+    files = {}
+    for vid in installed_versions(mc_dir):
+        for entry in version_tree_files(mc_dir, vid):
+            files.setdefault(entry[3], entry)
+    return list(files.values())
+
+
+# ---------- Linking ----------
+
+def same_file(a, b):
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def same_drive(a, b):
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+
+def link_to(blob, path):
+    return mod_store.link_into(blob, os.path.dirname(path), os.path.basename(path))
+
+
+def adopt(sha1, size, path):
+    """
+    Share an installed file through the store. Returns "linked", "adopted",
+    "skipped" (other drive) or "bad" (size/hash mismatch, left alone)
+    """
+    blob = blob_path(sha1)
+    with mod_store.blob_lock(sha1):
+        if os.path.exists(blob):
+            if same_file(blob, path):
+                return "linked"
+            if not same_drive(blob, path):
+                return "skipped"
+            link_to(blob, path)
+            return "adopted"
+
+        if size is not None and os.path.getsize(path) != size:
+            return "bad"
+        if downloader.file_sha1(path).lower() != sha1.lower():
+            return "bad"
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        tmp = blob + ".tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        try:
+            os.link(path, tmp)
+        except OSError:
+            return "skipped"
+        os.replace(tmp, blob)
+        return "adopted"
+
+
+def ensure(sha1, size, url, path, progress=None):
+    """
+    Make path hold the file with this sha1: relink it from the store or
+    download it into the store first. Returns "present", "linked" or "downloaded"
+    """
+    blob = blob_path(sha1)
+    if same_file(blob, path):
+        return "present"
+    with mod_store.blob_lock(sha1):
+        if os.path.exists(blob) and (size is None or os.path.getsize(blob) == size):
+            link_to(blob, path)
+            return "linked"
+        if os.path.exists(path) and (size is None or os.path.getsize(path) == size) \
+                and downloader.file_sha1(path).lower() == sha1.lower():
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.link(path, blob)
+            except OSError:
+                pass
+            return "present"
+        if not url:
+            raise FileNotFoundError(f"No download for {path}")
+        downloader.download(url, blob, progress=progress, hashes={"sha1": sha1}, size=size)
+        link_to(blob, path)
+        return "downloaded"
+
+
+def repair(sha1, size, url, path):
+    """
+    Replace a broken file; a store copy sharing its inode is broken too
+    """
+    blob = blob_path(sha1)
+    with mod_store.blob_lock(sha1):
+        if same_file(blob, path) or (os.path.exists(blob) and downloader.file_sha1(blob) != sha1):
+            os.remove(blob)
+        if os.path.exists(path):
+            os.remove(path)
+    return ensure(sha1, size, url, path)
+
+
+def run_all(func, entries, workers=WORKERS):
+    counts = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(lambda e: func(*e), entries):
+            counts[result] = counts.get(result, 0) + 1
+    return counts
+
+
+def import_root(mc_dir, workers=WORKERS):
+    add_root(mc_dir)
+    entries = [(sha1, size, path) for sha1, size, _, path in root_files(mc_dir) if os.path.exists(path)]
+    return run_all(adopt, entries, workers)
+
+
+# ---------- Garbage collection ----------
+
+def gc(dry_run=False):
+    """
+    Delete store objects that no installed version in any known root uses.
+    Returns (objects removed, bytes removed)
+    """
+    referenced = set()
+    for mc_dir in load_roots():
+        referenced.update(sha1.lower() for sha1, _, _, _ in root_files(mc_dir))
+
+    removed = 0
+    freed = 0
+    if not os.path.isdir(STORE_DIR):
+        return removed, freed
+    for bucket in os.scandir(STORE_DIR):
+        if not bucket.is_dir():
+            continue
+        for blob in os.scandir(bucket.path):
+            # Names with a "." are downloads or links still in progress
+            if blob.name in referenced or "." in blob.name:
+                continue
+            removed += 1
+            freed += blob.stat().st_size
+            if not dry_run:
+                os.remove(blob.path)
+    return removed, freed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    command = args[0] if args else ""
+    if command == "import":
+        for mc_dir in args[1:] or [instances.MC_DIR]:
+            print(mc_dir, import_root(mc_dir))
+    elif command == "gc":
+        count, size = gc(dry_run="--dry-run" in args)
+        print(f"{'Would remove' if '--dry-run' in args else 'Removed'} {count} objects, {size / 1048576:.1f} MiB")
+    else:
+        print("usage: game_store.py import [mc_dir ...] | gc [--dry-run]")
@@ -0,0 +1,253 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+import requests
+import downloader
+from paths import CACHE_DIR
+
+# On-disk cache for Modrinth API responses.
+# Entries are kept per URL+params in Cache/http, served directly while younger
+# than the endpoint's TTL and revalidated with ETag/Last-Modified afterwards.
+# The directory is capped at MAX_BYTES, evicting the least recently used.
+
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+MAX_BYTES = 64 * 1024 * 1024
+
+# (pattern, seconds) - first match wins
+TTLS = [
+    (re.compile(r"/v2/search"), 10 * 60),
+    (re.compile(r"/v2/project/[^/]+/version"), 15 * 60),
+    (re.compile(r"/v2/(project|projects|versions?)\b"), 60 * 60),
+    (re.compile(r"launchermeta|piston-meta"), 60 * 60),
+]
+DEFAULT_TTL = 5 * 60
+
+_lock = threading.Lock()
+_revalidating = set()
+_total_bytes = None  # size of HTTP_CACHE_DIR, counted once then kept up to date
+
+
+def ttl_for(url):
+    for pattern, ttl in TTLS:
+        if pattern.search(url):
+            return ttl
+    return DEFAULT_TTL
+
+
+def cache_key(url, params=None):
+    raw = url + "?" + json.dumps(params or {}, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def entry_path(key):
+    return os.path.join(HTTP_CACHE_DIR, key + ".json")
+
+
+def load_entry(key):
+    path = entry_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(path)  # mark as recently used
+    except OSError:
+        pass
+    return entry
+
+
+def file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def save_entry(key, entry):
+    global _total_bytes
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    path = entry_path(key)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(entry, f)
+    with _lock:
+        old_size = file_size(path)
+        os.replace(tmp, path)
+        if _total_bytes is not None:
+            _total_bytes += file_size(path) - old_size
+    if _total_bytes is None or _total_bytes > MAX_BYTES:
+        evict()
+
+
+def evict():
+    # Only scans the directory on the first write and when over the limit
+    global _total_bytes
+    with _lock:
+        files = []
+        total = 0
+        for e in os.scandir(HTTP_CACHE_DIR):
+            if not e.name.endswith(".json"):
+                continue
+            st = e.stat()
+            files.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+        _total_bytes = total
+        if total <= MAX_BYTES:
+            return
+        files.sort()
+        for _, size, path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            _total_bytes = total
+            if total <= MAX_BYTES:
+                break
+
+
+class Cancelled(Exception):
+    pass
+
+
+class CancelToken:
+    """
+    Lets another thread abort requests made with it by closing their responses
+    """
+    def __init__(self):
+        self.cancelled = False
+        self.responses = set()
+        self.lock = threading.Lock()
+
+    def cancel(self):
+        with self.lock:
+            self.cancelled = True
+            responses = list(self.responses)
+        for r in responses:
+            r.close()
+
+    def attach(self, r):
+        with self.lock:
+            if not self.cancelled:
+                self.responses.add(r)
+                return
+        r.close()
+        raise Cancelled()
+
+    def detach(self, r):
+        with self.lock:
+            self.responses.discard(r)
+
+
+def read_json(r, token):
+    if token is None:
+        return r.json()
+    chunks = []
+    try:
+        for chunk in r.iter_content(64 * 1024):
+            if token.cancelled:
+                raise Cancelled()
+            chunks.append(chunk)
+    except Cancelled:
+        raise
+    except Exception:
+        if token.cancelled:
+            raise Cancelled()
+        raise
+    return json.loads(b"".join(chunks))
+
+
+def request(url, params, entry, timeout, token=None):
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    r = downloader.get_session().get(
+        url, params=params, headers=headers, timeout=timeout, stream=token is not None
+    )
+    if token is not None:
+        token.attach(r)
+    try:
+        if r.status_code == 304 and entry:
+            entry["stored"] = time.time()
+            return entry, False
+        r.raise_for_status()
+        new_entry = {
+            "url": url,
+            "params": params or {},
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "stored": time.time(),
+            "body": read_json(r, token)
+        }
+    finally:
+        if token is not None:
+            token.detach(r)
+            r.close()
+    changed = not entry or entry.get("body") != new_entry["body"]
+    return new_entry, changed
+
+
+def revalidate(url, params, key, entry, timeout, on_update):
+    try:
+        new_entry, changed = request(url, params, entry, timeout)
+        save_entry(key, new_entry)
+        if changed and on_update:
+            on_update(new_entry["body"])
+    except (requests.RequestException, ValueError):
+        pass
+    finally:
+        with _lock:
+            _revalidating.discard(key)
+
+
+def peek(url, params=None):
+    """
+    Return the cached body for url regardless of age, without any network
+    """
+    entry = load_entry(cache_key(url, params))
+    return entry["body"] if entry else None
+
+
+def get_json(url, params=None, timeout=20, on_update=None, token=None):
+    """
+    GET a JSON endpoint through the cache.
+    With on_update, a stale entry is returned immediately and refreshed in the
+    background; on_update(body) is called (from that thread) if it changed.
+    A CancelToken aborts the network request; Cancelled is raised then.
+    """
+    key = cache_key(url, params)
+    entry = load_entry(key)
+
+    if entry and time.time() - entry.get("stored", 0) < ttl_for(url):
+        return entry["body"]
+
+    if entry and on_update:
+        with _lock:
+            busy = key in _revalidating
+            _revalidating.add(key)
+        if not busy:
+            threading.Thread(
+                target=revalidate,
+                args=(url, params, key, entry, timeout, on_update),
+                daemon=True
+            ).start()
+        return entry["body"]
+
+    try:
+        new_entry, _ = request(url, params, entry, timeout, token)
+    except requests.RequestException:
+        if token is not None and token.cancelled:
+            raise Cancelled()
+        if entry:
+            return entry["body"]  # offline: stale is better than nothing
+        raise
+    save_entry(key, new_entry)
+    return new_entry["body"]
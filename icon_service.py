@@ -0,0 +1,107 @@
+import os
+import io
+import hashlib
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageTk
+import downloader
+from paths import CACHE_DIR
+
+# Shared icon loader for the Modrinth cards.
+# A small fixed pool fetches icons, requests for the same URL are coalesced,
+# resized thumbnails are kept as PNGs in Cache/icons and the PhotoImages
+# themselves in an in-memory LRU, so known icons cost no network or resampling.
+
+ICON_CACHE_DIR = os.path.join(CACHE_DIR, "icons")
+ICON_SIZE = 96
+WORKERS = 6
+MEMORY_LIMIT = 300
+
+_pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="icons")
+_photos = OrderedDict()
+_pending = {}
+_lock = threading.Lock()
+
+
+def thumb_path(url, size):
+    key = hashlib.sha1(f"{size}:{url}".encode("utf-8")).hexdigest()
+    return os.path.join(ICON_CACHE_DIR, key[:2], key + ".png")
+
+
+def load_thumbnail(url, size):
+    """
+    Return a size x size PIL image for url, from disk if possible (worker thread)
+    """
+    path = thumb_path(url, size)
+    if os.path.exists(path):
+        try:
+            img = Image.open(path)
+            img.load()
+            return img
+        except OSError:
+            pass
+
+    r = downloader.get_session().get(url, timeout=10)
+    r.raise_for_status()
+    img = Image.open(io.BytesIO(r.content)).convert("RGBA").resize((size, size))
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    img.save(tmp, "PNG")
+    os.replace(tmp, path)
+    return img
+
+
+def remember(key, photo):
+    _photos[key] = photo
+    _photos.move_to_end(key)
+    while len(_photos) > MEMORY_LIMIT:
+        _photos.popitem(last=False)
+
+
+def deliver(key, img):
+    # Tk thread: PhotoImage must be created here
+    with _lock:
+        callbacks = _pending.pop(key, [])
+    if img is None:
+        return
+    photo = ImageTk.PhotoImage(img)
+    remember(key, photo)
+    for callback in callbacks:
+        callback(photo)
+
+
+def fetch(key, widget):
+    url, size = key
+    try:
+        img = load_thumbnail(url, size)
+    except Exception:
+        img = None
+    try:
+        widget.after(0, lambda: deliver(key, img))
+    except (RuntimeError, tk.TclError):
+        # Tk is gone (window closed)
+        with _lock:
+            _pending.pop(key, None)
+
+
+def load(url, widget, callback, size=ICON_SIZE):
+    """
+    Call callback(photo) on the Tk thread once the icon for url is ready.
+    widget is any live widget, used to get back onto the Tk thread.
+    """
+    key = (url, size)
+    photo = _photos.get(key)
+    if photo is not None:
+        _photos.move_to_end(key)
+        callback(photo)
+        return
+
+    with _lock:
+        if key in _pending:
+            _pending[key].append(callback)
+            return
+        _pending[key] = [callback]
+    _pool.submit(fetch, key, widget)
@@ -1,15 +1,13 @@
 import os
 import json
-import requests
+import mod_store
+import http_cache
+import instances
 
 # ---------------- Setup paths ----------------
 base_dir = os.path.dirname(os.path.abspath(__file__))
 data_file = os.path.join(base_dir, "launcher_data.json")
 
-mc_dir = os.path.join(os.getenv("APPDATA"), ".minecraft")  # Windows
-mods_dir = os.path.join(mc_dir, "mods")
-os.makedirs(mods_dir, exist_ok=True)
-
 # ---------------- Load launcher data ----------------
 def load_data():
     if os.path.exists(data_file):
@@ -17,6 +15,7 @@ def load_data():
     return {}
 
 data = load_data()
+mods_dir = instances.content_dir(instances.selected(data), "mods")
 mc_version = data.get("FabricAPI_Version")
 if not mc_version:
     raise SystemExit("FabricAPI_Version (Minecraft version) not set")
@@ -25,9 +24,7 @@ if not mc_version:
 project_id = "P7dR8mSH"
 api_url = f"https://api.modrinth.com/v2/project/{project_id}/version"
 
-resp = requests.get(api_url, timeout=20)
-resp.raise_for_status()
-versions = resp.json()
+versions = http_cache.get_json(api_url)
 
 selected = None
 for v in versions:
@@ -46,7 +43,6 @@ for f in selected["files"]:
 if not file_info:
     file_info = selected["files"][0]
 
-download_url = file_info["url"]
 filename = file_info["filename"]
 
 # ---------------- Download to mods folder ----------------
@@ -56,12 +52,6 @@ print("Downloading Fabric API for Minecraft", mc_version)
 print("File:", filename)
 print("Saving to Minecraft mods folder:", out_path)
 
-r = requests.get(download_url, stream=True, timeout=30)
-r.raise_for_status()
-
-with open(out_path, "wb") as f:
-    for chunk in r.iter_content(8192):
-        if chunk:
-            f.write(chunk)
+mod_store.install(file_info, mods_dir)
 
 print("Fabric API successfully installed in your mods folder!")
@@ -1,10 +1,8 @@
 import os
 import json
-import requests
-
-mods_dir = os.path.join(os.getenv("APPDATA"), ".minecraft", "mods")
-if not os.path.exists(mods_dir):
-    os.makedirs(mods_dir)
+import mod_store
+import http_cache
+import instances
 
 data_file = os.path.join(os.path.dirname(__file__), "launcher_data.json")
 
@@ -14,6 +12,7 @@ def load_data():
     return {}
 
 data = load_data()
+mods_dir = instances.content_dir(instances.selected(data), "mods")
 mc_version = data.get("FabricAPI_Version")
 if not mc_version:
     raise SystemExit("FabricAPI_Version not set in launcher_data.json")
@@ -21,9 +20,7 @@ if not mc_version:
 project_id = "oneblock-data-pack"
 api_url = f"https://api.modrinth.com/v2/project/{project_id}/version"
 
-resp = requests.get(api_url, timeout=20)
-resp.raise_for_status()
-versions = resp.json()
+versions = http_cache.get_json(api_url)
 
 selected = None
 for v in versions:
@@ -42,7 +39,6 @@ for f in selected["files"]:
 if not file_info:
     file_info = selected["files"][0]
 
-download_url = file_info["url"]
 filename = file_info["filename"]
 out_path = os.path.join(mods_dir, filename)
 
@@ -50,10 +46,5 @@ if os.path.exists(out_path):
     print(f"{filename} already exists, skipping download")
 else:
     print(f"Downloading {filename} for Minecraft {mc_version} (Fabric)...")
-    r = requests.get(download_url, stream=True, timeout=30)
-    r.raise_for_status()
-    with open(out_path, "wb") as f:
-        for chunk in r.iter_content(8192):
-            if chunk:
-                f.write(chunk)
+    mod_store.install(file_info, mods_dir)
     print(f"Downloaded to {out_path}")
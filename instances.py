@@ -0,0 +1,80 @@
+import os
+import re
+import json
+import shutil
+import platform
+from paths import base_dir
+
+# Instances are separate game directories (mods, config, saves, shaderpacks,
+# resourcepacks, options.txt) that all launch from the shared versions/,
+# libraries/ and assets/ in .minecraft. Only --gameDir changes between them,
+# so switching packs never touches another instance's mods folder.
+# The "default" instance is .minecraft itself, which keeps existing setups
+# working; the selected instance is stored as "instance" in launcher_data.json.
+
+if platform.system().startswith("Windows"):
+    MC_DIR = os.path.join(os.getenv("APPDATA"), ".minecraft")
+else:
+    MC_DIR = os.path.expanduser("~/.minecraft")
+
+INSTANCES_DIR = os.path.join(MC_DIR, "instances")
+DEFAULT = "default"
+SUBDIRS = ("mods", "config", "shaderpacks", "resourcepacks")
+
+DATA_FILE = os.path.join(base_dir, "launcher_data.json")
+
+
+def clean_name(name):
+    name = re.sub(r"[^\w\- .]", "", (name or "").strip()).strip(" .")
+    return name or DEFAULT
+
+
+def game_dir(name=None):
+    name = clean_name(name)
+    if name == DEFAULT:
+        return MC_DIR
+    return os.path.join(INSTANCES_DIR, name)
+
+
+def content_dir(name, sub):
+    """
+    mods/, config/, shaderpacks/... of an instance, created on first use
+    """
+    path = os.path.join(game_dir(name), sub)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def list_instances():
+    names = []
+    if os.path.isdir(INSTANCES_DIR):
+        names = sorted(e.name for e in os.scandir(INSTANCES_DIR) if e.is_dir())
+    return [DEFAULT] + [n for n in names if n != DEFAULT]
+
+
+def create(name, copy_options=True):
+    """
+    Create an empty instance; options.txt is copied so keybinds carry over
+    """
+    name = clean_name(name)
+    path = game_dir(name)
+    for sub in SUBDIRS:
+        os.makedirs(os.path.join(path, sub), exist_ok=True)
+    options = os.path.join(MC_DIR, "options.txt")
+    if copy_options and path != MC_DIR and os.path.exists(options) \
+            and not os.path.exists(os.path.join(path, "options.txt")):
+        shutil.copyfile(options, os.path.join(path, "options.txt"))
+    return name
+
+
+def selected(data=None):
+    """
+    Name of the instance chosen in launcher_data.json
+    """
+    if data is None:
+        try:
+            with open(DATA_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+    return clean_name(data.get("instance"))
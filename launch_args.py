@@ -0,0 +1,190 @@
+import os
+import re
+import json
+import threading
+import version_graph
+import natives
+from version_rules import rules_allow
+
+# Turns a (merged) version JSON into the java argv.
+# arguments.jvm / arguments.game entries are filtered by their OS and feature
+# rules once, at compile time; what is left is a flat list of strings with
+# ${...} placeholders. Everything that only depends on the version (assets
+# dir, asset index, natives dir, version name) is filled in right away and the
+# result is saved as versions/<id>/launch_template.json, so a launch only
+# checks the JSON files' mtimes and substitutes the per-launch values
+# (user, game dir, classpath).
+# Old versions without "arguments" use minecraftArguments and the jvm
+# arguments the official launcher adds for them.
+
+TEMPLATE_FORMAT = 2
+TEMPLATE_FILE = "launch_template.json"
+LAUNCHER_NAME = "TNTLauncher"
+LAUNCHER_VERSION = "1.0"
+
+LEGACY_JVM_ARGS = ["-Djava.library.path=${natives_directory}", "-cp", "${classpath}"]
+PLACEHOLDER = re.compile(r"\$\{([^}]+)\}")
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+# ---------- Compiling ----------
+
+def arg_values(entry, features):
+    if isinstance(entry, str):
+        return [entry]
+    if not rules_allow(entry.get("rules"), features):
+        return []
+    value = entry.get("value", [])
+    return [value] if isinstance(value, str) else list(value)
+
+
+def compile_args(version_data, features=None):
+    """
+    (jvm, game) argument lists with rules evaluated, placeholders kept
+    """
+    arguments = version_data.get("arguments") or {}
+    jvm = [v for entry in arguments.get("jvm", []) for v in arg_values(entry, features)]
+    game = [v for entry in arguments.get("game", []) for v in arg_values(entry, features)]
+    if version_data.get("minecraftArguments"):
+        # Legacy parent: a loader child may still add a few jvm flags of its own
+        game = version_data["minecraftArguments"].split() + game
+        jvm = LEGACY_JVM_ARGS + jvm
+    elif not jvm:
+        jvm = list(LEGACY_JVM_ARGS)
+    return jvm, game
+
+
+def render(args, values, keep_unknown=False):
+    """
+    Substitute ${name} in every argument; unknown names become "" unless kept
+    """
+    def sub(match):
+        name = match.group(1)
+        if name in values:
+            return str(values[name])
+        return match.group(0) if keep_unknown else ""
+    return [PLACEHOLDER.sub(sub, a) for a in args]
+
+
+def classpath_jars(mc_dir, version_data):
+    """
+    Library jars allowed on this OS followed by the client jar
+    """
+    jars = []
+    for lib in version_data.get("libraries", []):
+        if not rules_allow(lib.get("rules")):
+            continue
+        if "natives" in lib and not lib.get("downloads", {}).get("artifact"):
+            continue
+        path = version_graph.library_path(mc_dir, lib)
+        if path and path not in jars:
+            jars.append(path)
+    jar_id = version_data.get("jar") or version_data["id"]
+    jars.append(os.path.join(mc_dir, "versions", jar_id, f"{jar_id}.jar"))
+    return jars
+
+
+def compile_template(mc_dir, version_data, features=None):
+    version_id = version_data["id"]
+    asset_index = (version_data.get("assetIndex") or {}).get("id") or version_data.get("assets") or version_id
+    static = {
+        "version_name": version_id,
+        "version_type": version_data.get("type", "release"),
+        "assets_root": os.path.join(mc_dir, "assets"),
+        "game_assets": os.path.join(mc_dir, "assets"),
+        "assets_index_name": asset_index,
+        "natives_directory": os.path.join(mc_dir, "versions", version_id, "natives"),
+        "library_directory": os.path.join(mc_dir, "libraries"),
+        "classpath_separator": os.pathsep,
+        "launcher_name": LAUNCHER_NAME,
+        "launcher_version": LAUNCHER_VERSION,
+    }
+    jvm, game = compile_args(version_data, features)
+    return {
+        "format": TEMPLATE_FORMAT,
+        "version_id": version_id,
+        "features": features or {},
+        "files": version_data["files"],
+        "stamps": version_graph.file_stamps(version_data["files"]),
+        "main_class": version_data.get("mainClass"),
+        "asset_index": asset_index,
+        "natives_directory": static["natives_directory"],
+        "natives_jars": natives.native_jars(mc_dir, version_data),
+        "classpath": classpath_jars(mc_dir, version_data),
+        "jvm": render(jvm, static, keep_unknown=True),
+        "game": render(game, static, keep_unknown=True),
+    }
+
+
+# ---------- Cache ----------
+
+def template_path(mc_dir, version_id):
+    return os.path.join(mc_dir, "versions", version_id, TEMPLATE_FILE)
+
+
+def template_is_current(template, version_id, features):
+    return (
+        template.get("format") == TEMPLATE_FORMAT
+        and template.get("version_id") == version_id
+        and template.get("features") == (features or {})
+        and version_graph.file_stamps(template.get("files", [])) == template.get("stamps")
+    )
+
+
+def get_template(mc_dir, version_id, features=None):
+    """
+    Compiled template for version_id, from memory, disk or freshly built
+    """
+    key = (os.path.abspath(mc_dir), version_id)
+    with _memo_lock:
+        template = _memo.get(key)
+    if template is None:
+        try:
+            with open(template_path(mc_dir, version_id), "r", encoding="utf-8") as f:
+                template = json.load(f)
+        except (OSError, ValueError):
+            template = None
+    if template is None or not template_is_current(template, version_id, features):
+        template = compile_template(mc_dir, version_graph.resolve(mc_dir, version_id), features)
+        path = template_path(mc_dir, version_id)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(template, f, indent=2)
+        os.replace(tmp, path)
+    with _memo_lock:
+        _memo[key] = template
+    return template
+
+
+# ---------- Launching ----------
+
+def join_classpath(jars):
+    """
+    The jars that exist, joined; the client jar (last) stays even when missing
+    so Java names it in the error
+    """
+    return os.pathsep.join([jar for jar in jars[:-1] if os.path.exists(jar)] + jars[-1:])
+
+
+def launch_values(username, game_dir, classpath, uuid="00000000-0000-0000-0000-000000000000"):
+    return {
+        "auth_player_name": username,
+        "auth_uuid": uuid,
+        "auth_access_token": "0",
+        "auth_session": "0",
+        "user_type": "legacy",
+        "user_properties": "{}",
+        "clientid": "",
+        "auth_xuid": "",
+        "game_directory": game_dir,
+        "classpath": classpath,
+    }
+
+
+def command(java, template, values, extra_jvm=()):
+    """
+    Full argv: java, extra JVM flags (memory), JVM args, main class, game args
+    """
+    return [java, *extra_jvm, *render(template["jvm"], values), template["main_class"], *render(template["game"], values)]
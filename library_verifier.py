@@ -0,0 +1,98 @@
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import downloader
+import game_store
+import version_graph
+
+# Pre-launch integrity pass over the client jar and libraries of a version
+# (and whatever it inheritsFrom): each file is compared with the size and
+# sha1 from the version JSON in a thread pool, and broken ones are fetched
+# again. A file that passed is remembered by (size, mtime) in
+# libraries/verified.json, next to the file list of each version keyed by its
+# JSONs' stamps, so a launch with nothing changed neither parses version
+# JSONs nor hashes anything.
+
+WORKERS = 8
+CACHE_FILE = "verified.json"
+
+_lock = threading.Lock()
+
+
+def cache_path(mc_dir):
+    return os.path.join(mc_dir, "libraries", CACHE_FILE)
+
+
+def load_cache(mc_dir):
+    cache = game_store.read_json(cache_path(mc_dir)) or {}
+    cache.setdefault("files", {})
+    cache.setdefault("versions", {})
+    return cache
+
+
+def save_cache(mc_dir, cache):
+    path = cache_path(mc_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp, path)
+
+
+def launch_files(mc_dir, version_id, cache):
+    cached = cache["versions"].get(version_id)
+    if cached and version_graph.file_stamps(cached["jsons"]) == cached["stamps"]:
+        return [tuple(entry) for entry in cached["entries"]]
+    version_data = version_graph.resolve(mc_dir, version_id)
+    entries = version_graph.version_entries(mc_dir, version_data)
+    cache["versions"][version_id] = {
+        "jsons": version_data["files"],
+        "stamps": version_graph.file_stamps(version_data["files"]),
+        "entries": entries
+    }
+    return entries
+
+
+def file_ok(sha1, size, path, cached):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if size is not None and st.st_size != size:
+        return None
+    stamp = [st.st_size, st.st_mtime_ns, sha1]
+    if cached == stamp:
+        return stamp
+    return stamp if downloader.file_sha1(path) == sha1 else None
+
+
+def verify(mc_dir, version_id, repair=True, workers=WORKERS):
+    """
+    Check the launch files of version_id; returns the paths that were broken
+    """
+    with _lock:
+        cache = load_cache(mc_dir)
+        entries = launch_files(mc_dir, version_id, cache)
+        files = cache["files"]
+
+        def check(entry):
+            sha1, size, _, path = entry
+            return entry, file_ok(sha1, size, path, files.get(path))
+
+        broken = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for entry, stamp in pool.map(check, entries):
+                if stamp:
+                    files[entry[3]] = stamp
+                else:
+                    files.pop(entry[3], None)
+                    broken.append(entry)
+
+        if repair and broken:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for _ in pool.map(lambda e: game_store.repair(*e), broken):
+                    pass
+
+        save_cache(mc_dir, cache)
+        return [entry[3] for entry in broken]
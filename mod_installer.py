@@ -0,0 +1,126 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import mod_store
+import mods_index
+import version_resolver
+
+# Installs mods together with their required dependencies.
+# The dependency graph is walked breadth first, one batched resolver call per
+# level, then the whole closure is downloaded with bounded parallelism while a
+# single progress callback reports the combined byte count.
+
+WORKERS = 4
+
+
+def required_dependencies(version):
+    return [d for d in version.get("dependencies", []) if d.get("dependency_type") == "required"]
+
+
+def resolve_closure(project_ids, mc_version, loader="fabric"):
+    """
+    Return ({project_id: (version, file)}, [unresolved project/version ids])
+    """
+    closure = {}
+    missing = []
+    seen = set()
+    frontier = list(project_ids)
+
+    while frontier:
+        frontier = [pid for pid in dict.fromkeys(frontier) if pid not in seen]
+        if not frontier:
+            break
+        seen.update(frontier)
+
+        resolved = version_resolver.resolve(frontier, mc_version, loader)
+        pinned = []
+        next_frontier = []
+        for pid in frontier:
+            found = resolved.get(pid)
+            if not found:
+                missing.append(pid)
+                continue
+            version, _ = found
+            closure[version["project_id"]] = found
+            seen.add(version["project_id"])
+            for dep in required_dependencies(version):
+                if dep.get("version_id"):
+                    pinned.append(dep["version_id"])
+                elif dep.get("project_id"):
+                    next_frontier.append(dep["project_id"])
+
+        # Dependencies pinned to an exact version are fetched in one bulk call
+        for version in version_resolver.get_versions(list(dict.fromkeys(pinned))):
+            if version["project_id"] in closure:
+                continue
+            file = version_resolver.pick_file(version)
+            if not file:
+                missing.append(version["id"])
+                continue
+            closure[version["project_id"]] = (version, file)
+            seen.add(version["project_id"])
+            for dep in required_dependencies(version):
+                if dep.get("project_id"):
+                    next_frontier.append(dep["project_id"])
+
+        frontier = next_frontier
+
+    return closure, missing
+
+
+def install_with_dependencies(project_ids, mc_version, mods_dir, loader="fabric", progress=None, workers=WORKERS):
+    """
+    Install project_ids and everything they require into mods_dir.
+    progress(done_bytes, total_bytes, files_done, files_total) is called from
+    worker threads. Returns (installed, skipped, missing) lists.
+    """
+    closure, missing = resolve_closure(project_ids, mc_version, loader)
+    # Mods already in the folder count by Modrinth project or fabric.mod.json id,
+    # whatever their file is called or which version they are
+    installed_mods = mods_index.installed_projects(mods_dir)
+    slugs = {p["id"]: p.get("slug") for p in version_resolver.get_projects(list(closure))} if closure else {}
+
+    todo = []
+    skipped = []
+    sources = {}
+    for version, file in closure.values():
+        pid = version["project_id"]
+        existing = installed_mods.get(pid) or installed_mods.get(slugs.get(pid))
+        if existing:
+            same_file = existing["filename"] == file["filename"]
+            skipped.append(existing["filename"])
+            sources[existing["filename"]] = (pid, version["id"] if same_file else existing.get("version_id"))
+            continue
+        sources[file["filename"]] = (pid, version["id"])
+        if os.path.exists(os.path.join(mods_dir, file["filename"])):
+            skipped.append(file["filename"])
+        else:
+            todo.append(file)
+
+    total = sum(f.get("size", 0) for f in todo)
+    per_file = {}
+    finished = []
+    lock = threading.Lock()
+
+    def report():
+        if progress:
+            progress(sum(per_file.values()), total, len(finished), len(todo))
+
+    def install(file):
+        def file_progress(done, _total):
+            with lock:
+                per_file[file["filename"]] = done
+                report()
+        mod_store.install(file, mods_dir, progress=file_progress)
+        with lock:
+            per_file[file["filename"]] = file.get("size", 0)
+            finished.append(file["filename"])
+            report()
+        return file["filename"]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        installed = list(pool.map(install, todo))
+
+    for filename in installed + skipped:
+        mods_index.record_source(mods_dir, filename, *sources[filename])
+    return installed, skipped, missing
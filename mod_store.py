@@ -0,0 +1,85 @@
+import os
+import shutil
+import threading
+import downloader
+from paths import CACHE_DIR
+
+# Content-addressed store for everything installed from Modrinth.
+# Each file lives once in Cache/store/<aa>/<sha512> and is hardlinked (or
+# copied when linking is not possible) into mods/, shaderpacks/ or
+# resourcepacks/, so installing the same jar again costs no network or disk.
+
+STORE_DIR = os.path.join(CACHE_DIR, "store")
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def blob_path(sha512):
+    sha512 = sha512.lower()
+    return os.path.join(STORE_DIR, sha512[:2], sha512)
+
+
+def blob_lock(sha512):
+    with _locks_guard:
+        return _locks.setdefault(sha512, threading.Lock())
+
+
+def has_blob(sha512, size=None):
+    path = blob_path(sha512)
+    if not os.path.exists(path):
+        return False
+    return size is None or os.path.getsize(path) == size
+
+
+def fetch_blob(file_info, progress=None):
+    """
+    Make sure the Modrinth file (a "files" entry of a version) is in the store
+    and return its blob path. Downloads are verified against sha1/sha512.
+    """
+    hashes = file_info.get("hashes") or {}
+    sha512 = hashes.get("sha512")
+    if not sha512:
+        raise ValueError(f"No sha512 for {file_info.get('filename')}")
+
+    with blob_lock(sha512):
+        path = blob_path(sha512)
+        if has_blob(sha512, file_info.get("size")):
+            return path
+        downloader.download(file_info["url"], path, progress=progress, hashes=hashes, size=file_info.get("size"))
+        return path
+
+
+def link_into(blob, target_dir, filename):
+    os.makedirs(target_dir, exist_ok=True)
+    dest = os.path.join(target_dir, filename)
+    if os.path.exists(dest):
+        try:
+            if os.path.samefile(blob, dest):
+                return dest
+        except OSError:
+            pass
+
+    tmp = dest + ".link"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(blob, tmp)
+    except OSError:
+        # Different drive or a filesystem without hardlinks
+        shutil.copyfile(blob, tmp)
+    os.replace(tmp, dest)
+    return dest
+
+
+def install(file_info, target_dir, progress=None):
+    """
+    Install a Modrinth file into target_dir via the store and return its path
+    """
+    if not (file_info.get("hashes") or {}).get("sha512"):
+        dest = os.path.join(target_dir, file_info["filename"])
+        return downloader.download(
+            file_info["url"], dest, progress=progress, hashes=file_info.get("hashes"), size=file_info.get("size")
+        )
+    blob = fetch_blob(file_info, progress)
+    return link_into(blob, target_dir, file_info["filename"])
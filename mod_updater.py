@@ -0,0 +1,88 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import downloader
+import mod_store
+import mods_index
+
+# "Update all mods": every jar in mods/ is identified by its (cached) sha512,
+# one call to Modrinth's version_files/update returns the newest compatible
+# version for all of them, the replacements are downloaded in parallel into
+# the store and only then swapped into mods/, so a failed download leaves the
+# folder untouched.
+
+UPDATE_URL = "https://api.modrinth.com/v2/version_files/update"
+WORKERS = 6
+
+
+def primary_file(version):
+    for f in version.get("files", []):
+        if f.get("primary"):
+            return f
+    return version["files"][0] if version.get("files") else None
+
+
+def check_updates(mods_dir, mc_version, loader="fabric"):
+    """
+    Return [(old_filename, version, file)] for every jar with a newer version
+    """
+    current = mods_index.hashes(mods_dir)
+    if not current:
+        return []
+    r = downloader.get_session().post(UPDATE_URL, json={
+        "hashes": list(current.values()),
+        "algorithm": "sha512",
+        "loaders": [loader],
+        "game_versions": [mc_version]
+    }, timeout=30)
+    r.raise_for_status()
+    latest = r.json()
+
+    updates = []
+    for filename, sha512 in current.items():
+        version = latest.get(sha512)
+        if not version:
+            continue
+        file = primary_file(version)
+        if not file or file.get("hashes", {}).get("sha512") == sha512:
+            continue
+        updates.append((filename, version, file))
+    mods_index.mark_updates(mods_dir, {filename: version["id"] for filename, version, _ in updates})
+    return updates
+
+
+def apply_updates(updates, mods_dir, progress=None, workers=WORKERS):
+    """
+    Download all replacements, then swap them in. progress(done, total) counts files.
+    """
+    done = []
+    lock = threading.Lock()
+
+    def fetch(update):
+        _, _, file = update
+        blob = mod_store.fetch_blob(file)
+        with lock:
+            done.append(file["filename"])
+            if progress:
+                progress(len(done), len(updates))
+        return blob
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        blobs = list(pool.map(fetch, updates))
+
+    for (old_filename, version, file), blob in zip(updates, blobs):
+        mod_store.link_into(blob, mods_dir, file["filename"])
+        if old_filename != file["filename"]:
+            try:
+                os.remove(os.path.join(mods_dir, old_filename))
+            except OSError:
+                pass
+        mods_index.record_source(mods_dir, file["filename"], version["project_id"], version["id"])
+    return [file["filename"] for _, _, file in updates]
+
+
+def update_all(mods_dir, mc_version, loader="fabric", progress=None):
+    updates = check_updates(mods_dir, mc_version, loader)
+    if not updates:
+        return []
+    return apply_updates(updates, mods_dir, progress)
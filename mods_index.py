@@ -0,0 +1,174 @@
+import os
+import json
+import hashlib
+import zipfile
+import threading
+from paths import CACHE_DIR
+
+# Persistent index of what is actually in a mods folder.
+# Each jar's fabric.mod.json (id, version, depends) is read once and cached in
+# Cache/mods_index.json; it is only read again when the jar's size or mtime
+# changes. Jars installed by the launcher also remember their Modrinth
+# project/version so the browser can mark cards as installed.
+
+INDEX_PATH = os.path.join(CACHE_DIR, "mods_index.json")
+
+_lock = threading.RLock()
+_index = None
+
+
+def load_index():
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def save_index():
+    os.makedirs(os.path.dirname(INDEX_PATH), exist_ok=True)
+    tmp = INDEX_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_index, f, indent=1)
+    os.replace(tmp, INDEX_PATH)
+
+
+def read_mod_json(path):
+    try:
+        with zipfile.ZipFile(path) as z:
+            raw = z.read("fabric.mod.json")
+        meta = json.loads(raw.decode("utf-8-sig"), strict=False)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return {"id": None, "version": None, "name": None, "depends": {}}
+    return {
+        "id": meta.get("id"),
+        "version": meta.get("version"),
+        "name": meta.get("name"),
+        "depends": meta.get("depends", {})
+    }
+
+
+def folder_entries(mods_dir):
+    return load_index().setdefault(os.path.abspath(mods_dir), {})
+
+
+def scan_file(entries, path, st):
+    """
+    Refresh one jar's entry if its size/mtime changed; returns True if it did
+    """
+    name = os.path.basename(path)
+    entry = entries.get(name)
+    if entry and entry["size"] == st.st_size and entry["mtime"] == st.st_mtime_ns:
+        return False
+    entries[name] = dict(read_mod_json(path), size=st.st_size, mtime=st.st_mtime_ns)
+    return True
+
+
+def scan(mods_dir):
+    """
+    Return {filename: entry} for every jar in mods_dir
+    """
+    with _lock:
+        entries = folder_entries(mods_dir)
+        changed = False
+        present = set()
+        if os.path.isdir(mods_dir):
+            for e in os.scandir(mods_dir):
+                if not e.is_file() or not e.name.endswith(".jar"):
+                    continue
+                present.add(e.name)
+                changed |= scan_file(entries, e.path, e.stat())
+        for name in [n for n in entries if n not in present]:
+            del entries[name]
+            changed = True
+        if changed:
+            save_index()
+        return {name: dict(entry) for name, entry in entries.items()}
+
+
+def record_source(mods_dir, filename, project_id, version_id):
+    """
+    Remember which Modrinth project/version a jar came from
+    """
+    path = os.path.join(mods_dir, filename)
+    with _lock:
+        entries = folder_entries(mods_dir)
+        try:
+            scan_file(entries, path, os.stat(path))
+        except OSError:
+            return
+        entries[filename].update(project_id=project_id, version_id=version_id)
+        # A freshly installed jar is what the update check pointed at
+        entries[filename].pop("update_version", None)
+        save_index()
+
+
+def file_sha512(path):
+    h = hashlib.sha512()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hashes(mods_dir):
+    """
+    {filename: sha512} for every jar; only new or changed jars are hashed
+    """
+    entries = scan(mods_dir)
+    result = {}
+    changed = False
+    for name, entry in entries.items():
+        if not entry.get("sha512"):
+            entry["sha512"] = file_sha512(os.path.join(mods_dir, name))
+            with _lock:
+                live = folder_entries(mods_dir).get(name)
+                if live and live["mtime"] == entry["mtime"]:
+                    live["sha512"] = entry["sha512"]
+                    changed = True
+        result[name] = entry["sha512"]
+    if changed:
+        with _lock:
+            save_index()
+    return result
+
+
+def mark_updates(mods_dir, updates):
+    """
+    Store the result of an update check: {filename: newer version id}.
+    Jars not in updates lose any update mark they had.
+    """
+    with _lock:
+        for filename, entry in folder_entries(mods_dir).items():
+            if filename in updates:
+                entry["update_version"] = updates[filename]
+            else:
+                entry.pop("update_version", None)
+        save_index()
+
+
+def installed_projects(mods_dir):
+    """
+    {Modrinth project id or mod id: entry} for the jars in mods_dir
+    """
+    installed = {}
+    for name, entry in scan(mods_dir).items():
+        entry["filename"] = name
+        if entry.get("id"):
+            installed[entry["id"]] = entry
+        if entry.get("project_id"):
+            installed[entry["project_id"]] = entry
+    return installed
+
+
+def card_state(installed, hit):
+    """
+    "update", "installed" or None for a search hit
+    """
+    entry = installed.get(hit.get("project_id")) or installed.get(hit.get("slug"))
+    if not entry:
+        return None
+    return "update" if entry.get("update_version") else "installed"
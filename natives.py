@@ -0,0 +1,119 @@
+import os
+import json
+import zipfile
+import zlib
+import version_graph
+from downloader import file_sha1
+from version_rules import os_name, arch_bits, rules_allow
+
+# Native classifier jars (lwjgl & co) are unpacked into versions/<id>/natives.
+# versions/<id>/natives_manifest.json remembers which jar (by hash) produced
+# which files, so unchanged jars are skipped and only missing or differing
+# entries get written again. Used right after an install and before a launch.
+
+NATIVES_MANIFEST = "natives_manifest.json"
+
+
+def native_jars(mc_dir, version_data):
+    """
+    Paths of the native classifier jars this OS needs for a merged version
+    """
+    jars = []
+    for lib in version_data.get("libraries", []):
+        if os_name() not in lib.get("natives", {}) or not rules_allow(lib.get("rules")):
+            continue
+        classifier = lib["natives"][os_name()].replace("${arch}", arch_bits())
+        jar_file = version_graph.library_path(mc_dir, lib, classifier)
+        if jar_file:
+            jars.append(jar_file)
+    return jars
+
+
+def load_natives_manifest(path):
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return {"jars": {}}
+
+
+def file_crc32(path):
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def native_entry_ok(target, size, crc):
+    try:
+        if os.path.getsize(target) != size:
+            return False
+    except OSError:
+        return False
+    return file_crc32(target) == crc
+
+
+def unpack_native_jar(jar_file, natives_path, known_entries):
+    entries = {}
+    with zipfile.ZipFile(jar_file, "r") as zip_ref:
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            entries[info.filename] = [info.file_size, info.CRC]
+            target = os.path.join(natives_path, *info.filename.split("/"))
+            if known_entries.get(info.filename) == entries[info.filename] and os.path.exists(target) \
+                    and os.path.getsize(target) == info.file_size:
+                continue
+            if native_entry_ok(target, info.file_size, info.CRC):
+                continue
+            zip_ref.extract(info, natives_path)
+    return entries
+
+
+def unpack_natives(jars, natives_path):
+    """
+    Bring natives_path up to date with jars, skipping the ones already unpacked
+    """
+    os.makedirs(natives_path, exist_ok=True)
+    manifest_path = os.path.join(os.path.dirname(natives_path), NATIVES_MANIFEST)
+    manifest = load_natives_manifest(manifest_path)
+    known = manifest.get("jars", {})
+    updated = {}
+    changed = False
+
+    for jar_file in jars:
+        if not os.path.exists(jar_file):
+            continue
+        st = os.stat(jar_file)
+        record = known.get(jar_file)
+        if record and record.get("mtime") == st.st_mtime_ns and record.get("size") == st.st_size:
+            sha1 = record["sha1"]
+        else:
+            sha1 = file_sha1(jar_file)
+            changed = True
+
+        if record and record.get("sha1") == sha1:
+            missing = [
+                name for name, (size, _) in record["entries"].items()
+                if not os.path.exists(os.path.join(natives_path, *name.split("/")))
+                or os.path.getsize(os.path.join(natives_path, *name.split("/"))) != size
+            ]
+            entries = record["entries"]
+            if missing:
+                entries = unpack_native_jar(jar_file, natives_path, {})
+                changed = True
+        else:
+            entries = unpack_native_jar(jar_file, natives_path, record["entries"] if record else {})
+            changed = True
+
+        updated[jar_file] = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha1": sha1, "entries": entries}
+
+    if changed or set(updated) != set(known):
+        tmp = manifest_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"jars": updated}, f, indent=2)
+        os.replace(tmp, manifest_path)
+    return natives_path
@@ -0,0 +1,13 @@
+import os
+import sys
+
+# Locations shared by the launcher modules.
+# base_dir is the launcher folder (next to the exe when frozen); everything
+# the launcher caches lives under Cache/ in it.
+
+if getattr(sys, 'frozen', False):
+    base_dir = os.path.dirname(sys.executable)
+else:
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+CACHE_DIR = os.path.join(base_dir, "Cache")
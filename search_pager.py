@@ -0,0 +1,147 @@
+import threading
+import http_cache
+import catalog_index
+
+# Offset-based pagination over Modrinth's search endpoint.
+# The page after the one on screen is always prefetched, fetched pages are
+# kept until shown, and hits are de-duplicated by project_id because results
+# can shift between pages while the user scrolls.
+# All state is touched on the Tk thread only; fetches run in daemon threads.
+
+PAGE_SIZE = 40
+
+
+class SearchPager:
+    def __init__(self, widget, url, params, on_items, on_error, page_size=PAGE_SIZE):
+        self.widget = widget
+        self.url = url
+        self.params = dict(params)
+        self.on_items = on_items  # on_items(new_hits, first_page)
+        self.on_error = on_error
+        self.page_size = page_size
+
+        self.offset = 0          # offset of the next page to show
+        self.total = None
+        self.seen = set()
+        self.pages = {}          # offset -> hits, fetched but not shown yet
+        self.loading = set()
+        self.waiting = False     # the grid asked for the next page
+        self.cancelled = False
+        self.token = http_cache.CancelToken()
+
+    def cancel(self):
+        # Drops every pending callback and aborts the requests still in flight
+        self.cancelled = True
+        self.token.cancel()
+
+    def exhausted(self):
+        return self.total is not None and self.offset >= self.total
+
+    def load_more(self):
+        if self.cancelled or self.waiting or self.exhausted():
+            return
+        hits = self.pages.pop(self.offset, None)
+        if hits is None:
+            self.waiting = True
+            self.fetch(self.offset)
+        else:
+            self.deliver(self.offset, hits)
+
+    def deliver(self, offset, hits):
+        self.waiting = False
+        self.offset = offset + self.page_size
+        new = []
+        for hit in hits:
+            if hit["project_id"] not in self.seen:
+                self.seen.add(hit["project_id"])
+                new.append(hit)
+        self.on_items(new, offset == 0)
+        self.fetch(self.offset)  # prefetch
+
+    def fetch(self, offset):
+        if offset in self.loading or offset in self.pages:
+            return
+        if self.total is not None and offset >= self.total:
+            return
+        self.loading.add(offset)
+        threading.Thread(target=self.fetch_thread, args=(offset,), daemon=True).start()
+
+    def fetch_page(self, offset, on_update):
+        params = dict(self.params, limit=self.page_size, offset=offset)
+        result = http_cache.get_json(self.url, params, timeout=15, on_update=on_update, token=self.token)
+        try:
+            catalog_index.add_hits(result["hits"])
+        except Exception:
+            pass  # the local index is best effort
+        return result
+
+    def fetch_thread(self, offset):
+        on_update = None
+        if offset == 0:
+            on_update = lambda fresh: self.widget.after(0, lambda: self.refreshed(fresh))
+        try:
+            result = self.fetch_page(offset, on_update)
+        except http_cache.Cancelled:
+            return
+        except Exception as e:
+            error = e
+            self.widget.after(0, lambda: self.failed(offset, error))
+            return
+        self.widget.after(0, lambda: self.fetched(offset, result))
+
+    def fetched(self, offset, result):
+        self.loading.discard(offset)
+        if self.cancelled:
+            return
+        self.total = result.get("total_hits", self.total)
+        if self.waiting and offset == self.offset:
+            self.deliver(offset, result["hits"])
+        else:
+            self.pages[offset] = result["hits"]
+
+    def failed(self, offset, error):
+        self.loading.discard(offset)
+        if self.cancelled:
+            return
+        if self.waiting and offset == self.offset:
+            self.waiting = False
+            self.on_error(error)
+
+    def refreshed(self, result):
+        # Background revalidation of page one; only redraw if nothing else is shown yet
+        if self.cancelled or self.offset != self.page_size:
+            return
+        self.total = result.get("total_hits", self.total)
+        self.seen = set()
+        self.pages.pop(self.offset, None)
+        self.offset = 0
+        self.deliver(0, result["hits"])
+
+
+class LocalSearchPager(SearchPager):
+    """
+    Same paging, but answered from the local catalog index. The index only
+    holds the most downloaded projects, so when the first page comes back short
+    the search goes to url/params instead, if the network is there.
+    """
+    def __init__(self, widget, query, filters, on_items, on_error, url=None, params=None, page_size=PAGE_SIZE):
+        super().__init__(widget, url, params or {}, on_items, on_error, page_size)
+        self.query = query
+        self.filters = filters
+        self.online = False
+
+    def fetch_page(self, offset, on_update):
+        if self.online:
+            return super().fetch_page(offset, on_update)
+        result = catalog_index.search(self.query, limit=self.page_size, offset=offset, **self.filters)
+        if offset == 0 and self.url and len(result["hits"]) < self.page_size:
+            try:
+                online = super().fetch_page(offset, on_update)
+            except http_cache.Cancelled:
+                raise
+            except Exception:
+                return result  # offline: the local hits are all there is
+            # Later pages have to come from the same result list
+            self.online = True
+            return online
+        return result
@@ -1,8 +1,8 @@
 import os
 import shutil
 import zipfile
-import requests
 import sys
+import downloader
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 script_path = os.path.abspath(__file__)
@@ -15,16 +15,16 @@ GITHUB_ZIP_URL = "https://github.com/cringsimulator-a11y/TNTLauncher/archive/ref
 
 os.makedirs(TEMP_DIR, exist_ok=True)
 
-r = requests.get(GITHUB_ZIP_URL, stream=True, timeout=30)
-r.raise_for_status()
+# Goes through repo.zip.part, so an interrupted update resumes and a broken
+# zip is never extracted over the install
+downloader.download(GITHUB_ZIP_URL, ZIP_PATH, timeout=30)
 
-with open(ZIP_PATH, "wb") as f:
-    for chunk in r.iter_content(8192):
-        if chunk:
-            f.write(chunk)
-
-with zipfile.ZipFile(ZIP_PATH, "r") as z:
-    z.extractall(TEMP_DIR)
+try:
+    with zipfile.ZipFile(ZIP_PATH, "r") as z:
+        z.extractall(TEMP_DIR)
+except zipfile.BadZipFile:
+    os.remove(ZIP_PATH)
+    raise SystemExit("Downloaded update is corrupt, run the update again")
 
 os.remove(ZIP_PATH)
 
@@ -3,11 +3,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import json
-import minecraft_launcher_lib
+import version_installer
 
 MC_DIR = os.path.join(os.getenv("APPDATA"), ".minecraft")
 DATA_FILE = "launcher_data.json"
 DEFAULT_VERSION = "1.21.1"
+FRAME_MS = 100  # progress redraws per second = 1000 / FRAME_MS
 
 
 def load_launcher_data():
@@ -30,7 +31,16 @@ def load_launcher_data():
     return data["download_version"]
 
 
+def load_workers():
+    try:
+        with open(DATA_FILE, "r") as f:
+            return int(json.load(f).get("install_workers", version_installer.WORKERS))
+    except (OSError, ValueError, TypeError):
+        return version_installer.WORKERS
+
+
 DOWNLOAD_VERSION = load_launcher_data()
+WORKERS = load_workers()
 
 
 root = tk.Tk()
@@ -55,47 +65,38 @@ percent_label = tk.Label(root, text="0%")
 percent_label.pack()
 
 
-def install_version():
-    def set_status(text):
-        root.after(0, lambda: status_label.config(text=text))
-
-    def set_progress(value):
-        root.after(0, lambda: progress.config(value=value))
-        if progress["maximum"] > 0:
-            percent = (value / progress["maximum"]) * 100
-            root.after(0, lambda: percent_label.config(text=f"{int(percent)}%"))
-
-    def set_max(value):
-        root.after(0, lambda: progress.config(maximum=value))
-
-    callbacks = {
-        "setStatus": set_status,
-        "setProgress": set_progress,
-        "setMax": set_max
-    }
-
+def install_version(state):
     try:
-        set_status("Downloading files...")
-        minecraft_launcher_lib.install.install_minecraft_version(
-            DOWNLOAD_VERSION,
-            MC_DIR,
-            callback=callbacks
-        )
-        set_progress(progress["maximum"])
-        set_status("Installation complete")
-        messagebox.showinfo(
+        version_installer.install_version(DOWNLOAD_VERSION, MC_DIR, WORKERS, state)
+        root.after(0, lambda: messagebox.showinfo(
             "Done",
             f"Minecraft {DOWNLOAD_VERSION} installed successfully"
-        )
+        ))
     except Exception as e:
-        set_status("Error")
-        messagebox.showerror("Error", str(e))
+        message = str(e)
+        state.set_status("Error")
+        root.after(0, lambda: messagebox.showerror("Error", message))
+    finally:
+        state.finished = True
+
+
+def poll(state):
+    # Redraw from the shared progress at a fixed rate, however fast files finish
+    snap = state.snapshot()
+    status_label.config(text=f"{snap['status']} {snap['files_done']}/{snap['files_total']} files")
+    if snap["bytes_total"]:
+        progress.config(maximum=snap["bytes_total"], value=snap["bytes_done"])
+        percent_label.config(text=f"{int(snap['bytes_done'] * 100 / snap['bytes_total'])}%")
+    if not state.finished:
+        root.after(FRAME_MS, lambda: poll(state))
 
 
 def start_install():
     progress["value"] = 0
     percent_label.config(text="0%")
-    threading.Thread(target=install_version, daemon=True).start()
+    state = version_installer.InstallProgress()
+    threading.Thread(target=install_version, args=(state,), daemon=True).start()
+    poll(state)
 
 
 install_btn = tk.Button(
@@ -0,0 +1,204 @@
+import os
+import re
+import json
+import threading
+from version_rules import os_name, arch_bits, rules_allow
+
+# Resolves a version JSON together with everything it inheritsFrom into one
+# merged description: libraries (deduplicated by group:artifact[:classifier],
+# the newest version wins), arguments, assetIndex, mainClass and the client
+# jar to put on the classpath. Results are memoized per version id and only
+# rebuilt when one of the JSON files in the chain changes on disk.
+# version_entries lists the files a version needs as (sha1, size, url, path),
+# for the installer and the pre-launch verifier alike.
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+def version_json_path(mc_dir, version_id):
+    return os.path.join(mc_dir, "versions", version_id, f"{version_id}.json")
+
+
+def maven_path(name, classifier=None):
+    """
+    "group:artifact:version[:classifier]" -> "group/.../artifact/version/artifact-version[-classifier].jar"
+    """
+    parts = name.split(":")
+    if len(parts) < 3:
+        return None
+    group, artifact, version = parts[:3]
+    classifier = classifier or (parts[3] if len(parts) > 3 else None)
+    suffix = f"-{classifier}" if classifier else ""
+    return "/".join(group.split(".") + [artifact, version, f"{artifact}-{version}{suffix}.jar"])
+
+
+def library_path(mc_dir, lib, classifier=None):
+    """
+    Where a library (or one of its native classifiers) lives under libraries/
+    """
+    artifact = lib.get("downloads", {}).get("artifact")
+    if artifact and artifact.get("path") and not classifier:
+        rel = artifact["path"]
+    else:
+        rel = maven_path(lib.get("name", ""), classifier)
+    return os.path.join(mc_dir, "libraries", *rel.split("/")) if rel else None
+
+
+def library_entries(mc_dir, version_data, all_os=False):
+    """
+    (sha1, size, url, path) for the libraries this OS uses; with all_os every
+    library and native classifier is listed, whatever its rules (for gc)
+    """
+    entries = []
+    for lib in version_data.get("libraries", []):
+        if not all_os and not rules_allow(lib.get("rules")):
+            continue
+        downloads = lib.get("downloads", {})
+        classifiers = downloads.get("classifiers", {})
+        arts = [downloads.get("artifact")]
+        if all_os:
+            arts += list(classifiers.values())
+        elif os_name() in lib.get("natives", {}):
+            arts.append(classifiers.get(lib["natives"][os_name()].replace("${arch}", arch_bits())))
+        for art in arts:
+            if art and art.get("sha1") and art.get("path"):
+                entries.append((art["sha1"], art.get("size"), art.get("url") or None,
+                                os.path.join(mc_dir, "libraries", *art["path"].split("/"))))
+        # Fabric style: maven coordinates, a repository url and a flat sha1
+        rel = maven_path(lib.get("name", "")) if not downloads and lib.get("sha1") else None
+        if rel:
+            url = lib["url"].rstrip("/") + "/" + rel if lib.get("url") else None
+            entries.append((lib["sha1"], lib.get("size"), url,
+                            os.path.join(mc_dir, "libraries", *rel.split("/"))))
+    return entries
+
+
+def version_entries(mc_dir, version_data, all_os=False):
+    """
+    (sha1, size, url, path) for the client jar, libraries and logging config
+    """
+    jar_id = version_data.get("jar") or version_data["id"]
+    entries = []
+    client = version_data.get("downloads", {}).get("client")
+    if client:
+        entries.append((client["sha1"], client.get("size"), client["url"],
+                        os.path.join(mc_dir, "versions", jar_id, f"{jar_id}.jar")))
+    entries += library_entries(mc_dir, version_data, all_os)
+    logging_file = version_data.get("logging", {}).get("client", {}).get("file")
+    if logging_file:
+        entries.append((logging_file["sha1"], logging_file.get("size"), logging_file["url"],
+                        os.path.join(mc_dir, "assets", "log_configs", logging_file["id"])))
+    return entries
+
+
+def load_chain(mc_dir, version_id, partial=False):
+    """
+    [(path, data)] from version_id up to the root parent; with partial a
+    missing parent ends the chain instead of raising
+    """
+    chain = []
+    seen = set()
+    while version_id and version_id not in seen:
+        seen.add(version_id)
+        path = version_json_path(mc_dir, version_id)
+        if not os.path.exists(path):
+            if partial and chain:
+                break
+            raise FileNotFoundError(f"Version JSON not found: {path}")
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        chain.append((path, data))
+        version_id = data.get("inheritsFrom")
+    return chain
+
+
+def file_stamps(paths):
+    stamps = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamps.append([st.st_mtime_ns, st.st_size])
+    return stamps
+
+
+def version_key(version):
+    # "0.16.10" > "0.16.9", numbers before text
+    return [(0, int(p)) if p.isdigit() else (1, p) for p in re.split(r"[.\-+_]", version)]
+
+
+def library_key(name):
+    parts = name.split(":")
+    if len(parts) < 3:
+        return name, ""
+    group, artifact, version = parts[:3]
+    classifier = ":".join(parts[3:])
+    return f"{group}:{artifact}:{classifier}", version
+
+
+def merge_libraries(chain):
+    """
+    Parent libraries first, then the child's; same group:artifact keeps the
+    newest version in the slot where it first appeared
+    """
+    merged = {}
+    for _, data in reversed(chain):
+        for lib in data.get("libraries", []):
+            key, version = library_key(lib.get("name", ""))
+            # Rules make two entries with the same name distinct (per-OS natives)
+            if lib.get("rules"):
+                key += json.dumps(lib["rules"], sort_keys=True)
+            current = merged.get(key)
+            if current is None or version_key(version) >= version_key(library_key(current["name"])[1]):
+                merged[key] = lib
+    return list(merged.values())
+
+
+def merge(chain):
+    child = chain[0][1]
+    root = chain[-1][1]
+    resolved = {
+        "id": child["id"],
+        "chain": [data["id"] for _, data in chain],
+        "libraries": merge_libraries(chain),
+        "arguments": {"game": [], "jvm": []},
+        "minecraftArguments": None,
+        "mainClass": None,
+        "assetIndex": None,
+        "assets": None,
+        "jar": root.get("jar") or root["id"],
+        "downloads": {},
+        "javaVersion": None,
+        "logging": {},
+    }
+    for _, data in reversed(chain):
+        for kind in ("game", "jvm"):
+            resolved["arguments"][kind] += data.get("arguments", {}).get(kind, [])
+        for field in ("minecraftArguments", "mainClass", "assetIndex", "assets", "javaVersion"):
+            if data.get(field):
+                resolved[field] = data[field]
+        if data.get("jar"):
+            resolved["jar"] = data["jar"]
+        resolved["downloads"].update(data.get("downloads", {}))
+        resolved["logging"].update(data.get("logging", {}))
+    return resolved
+
+
+def resolve(mc_dir, version_id, partial=False):
+    """
+    Merged version description for version_id (see merge)
+    """
+    key = (os.path.abspath(mc_dir), version_id, partial)
+    with _memo_lock:
+        cached = _memo.get(key)
+    if cached and file_stamps(cached[1]["files"]) == cached[0]:
+        return cached[1]
+
+    chain = load_chain(mc_dir, version_id, partial)
+    resolved = merge(chain)
+    resolved["files"] = [path for path, _ in chain]
+    with _memo_lock:
+        _memo[key] = (file_stamps(resolved["files"]), resolved)
+    return resolved
@@ -0,0 +1,144 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import downloader
+import http_cache
+import game_store
+import version_graph
+import natives
+
+# Installs a Minecraft version without minecraft_launcher_lib.
+# The version JSON and asset index are fetched first, then the client jar,
+# libraries, natives and every asset object go through one thread pool.
+# Files already on disk with the right sha1 are skipped and files the shared
+# store (game_store.py) has are hardlinked instead of downloaded.
+# Progress is only written into an InstallProgress; the UI polls it at its
+# own frame rate instead of receiving a callback per file.
+
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest_v2.json"
+WORKERS = 16
+
+
+class InstallProgress:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.status = "Waiting..."
+        self.files_total = 0
+        self.files_done = 0
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.downloaded = 0
+        self.partial = {}   # path -> bytes of a download in flight
+        self.started = time.perf_counter()
+        self.finished = False
+
+    def set_status(self, text):
+        with self.lock:
+            self.status = text
+
+    def add_files(self, entries):
+        with self.lock:
+            self.files_total += len(entries)
+            self.bytes_total += sum(e[1] or 0 for e in entries)
+
+    def file_progress(self, path, done):
+        with self.lock:
+            self.partial[path] = done
+
+    def file_done(self, path, size, result):
+        with self.lock:
+            self.partial.pop(path, None)
+            self.files_done += 1
+            self.bytes_done += size or 0
+            if result == "downloaded":
+                self.downloaded += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "status": self.status,
+                "files_done": self.files_done,
+                "files_total": self.files_total,
+                "bytes_done": self.bytes_done + sum(self.partial.values()),
+                "bytes_total": self.bytes_total,
+                "downloaded": self.downloaded,
+                "elapsed": time.perf_counter() - self.started
+            }
+
+
+# ---------- What to download ----------
+
+def manifest_entry(version_id):
+    manifest = http_cache.get_json(VERSION_MANIFEST_URL)
+    for v in manifest.get("versions", []):
+        if v["id"] == version_id:
+            return v
+    return None
+
+
+def fetch_version_json(mc_dir, version_id):
+    """
+    Make sure versions/<id>/<id>.json is there and return it
+    """
+    path = version_graph.version_json_path(mc_dir, version_id)
+    entry = manifest_entry(version_id)
+    if entry and entry.get("sha1"):
+        game_store.ensure(entry["sha1"], None, entry["url"], path)
+    elif entry:
+        downloader.download(entry["url"], path)
+    elif not os.path.exists(path):
+        raise RuntimeError(f"Unknown Minecraft version: {version_id}")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------- Install ----------
+
+def install_entries(entries, progress, workers):
+    progress.add_files(entries)
+
+    def run(entry):
+        sha1, size, url, path = entry
+        result = game_store.ensure(sha1, size, url, path,
+                                   progress=lambda done, _total: progress.file_progress(path, done))
+        progress.file_done(path, size, result)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in pool.map(run, entries):
+            pass
+
+
+def install_version(version_id, mc_dir, workers=WORKERS, progress=None):
+    """
+    Install version_id (and whatever it inheritsFrom) into mc_dir
+    """
+    progress = progress or InstallProgress()
+    chain = []
+    next_id = version_id
+    while next_id:
+        progress.set_status(f"Reading {next_id}...")
+        data = fetch_version_json(mc_dir, next_id)
+        chain.append(data)
+        next_id = data.get("inheritsFrom")
+
+    entries = {}
+    for data in chain:
+        index = data.get("assetIndex")
+        if index:
+            index_path = os.path.join(mc_dir, "assets", "indexes", f"{index['id']}.json")
+            game_store.ensure(index["sha1"], index.get("size"), index["url"], index_path)
+            for entry in game_store.asset_files(mc_dir, index["id"]):
+                entries.setdefault(entry[3], entry)
+        for entry in version_graph.version_entries(mc_dir, data):
+            entries.setdefault(entry[3], entry)
+
+    progress.set_status("Downloading files...")
+    install_entries(list(entries.values()), progress, workers)
+    progress.set_status("Extracting natives...")
+    natives.unpack_natives(natives.native_jars(mc_dir, version_graph.resolve(mc_dir, version_id)),
+                           os.path.join(mc_dir, "versions", version_id, "natives"))
+    game_store.add_root(mc_dir)
+    progress.set_status("Installation complete")
+    return progress
@@ -0,0 +1,142 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import http_cache
+
+# Resolves (project, mc_version, loader) to the version and file to install,
+# using as few Modrinth requests as possible:
+#   1. one /projects?ids=[...] call for the whole batch, which also drops
+#      projects that don't support the loader/game version at all,
+#   2. one /versions?ids=[...] call for the newest RECENT_VERSIONS versions of
+#      every remaining project (a project's "versions" list is oldest first),
+#      filtered locally,
+#   3. the server-side filtered /project/<id>/version endpoint only for the
+#      projects whose match is older than that window.
+# Results are memoized per process; the HTTP layer caches them on disk.
+
+API = "https://api.modrinth.com/v2"
+IDS_PER_REQUEST = 100
+RECENT_VERSIONS = 8
+WORKERS = 6
+
+_memo = {}
+_memo_lock = threading.Lock()
+
+
+def chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def pick_file(version):
+    """
+    Primary jar if there is one, otherwise the first jar; never the loader itself
+    """
+    jars = [
+        f for f in version.get("files", [])
+        if f.get("filename", "").lower().endswith(".jar")
+        and "fabric-loader" not in f.get("filename", "").lower()
+    ]
+    for f in jars:
+        if f.get("primary"):
+            return f
+    return jars[0] if jars else None
+
+
+def matches(version, mc_version, loader):
+    if loader and loader not in version.get("loaders", []):
+        return False
+    if mc_version and mc_version not in version.get("game_versions", []):
+        return False
+    return pick_file(version) is not None
+
+
+def get_projects(ids):
+    projects = []
+    for batch in chunks(ids, IDS_PER_REQUEST):
+        projects += http_cache.get_json(f"{API}/projects", {"ids": json.dumps(batch)})
+    return projects
+
+
+def get_versions(ids):
+    versions = []
+    for batch in chunks(ids, IDS_PER_REQUEST):
+        versions += http_cache.get_json(f"{API}/versions", {"ids": json.dumps(batch)})
+    return versions
+
+
+def get_filtered_versions(project_id, mc_version, loader):
+    params = {}
+    if loader:
+        params["loaders"] = json.dumps([loader])
+    if mc_version:
+        params["game_versions"] = json.dumps([mc_version])
+    return http_cache.get_json(f"{API}/project/{project_id}/version", params)
+
+
+def newest_match(versions, mc_version, loader):
+    found = [v for v in versions if matches(v, mc_version, loader)]
+    found.sort(key=lambda v: v.get("date_published", ""), reverse=True)
+    return found[0] if found else None
+
+
+def resolve(project_ids, mc_version, loader="fabric"):
+    """
+    Map each project id or slug to (version, file), or None when nothing fits
+    """
+    result = {}
+    todo = []
+    with _memo_lock:
+        for pid in dict.fromkeys(project_ids):
+            key = (pid, mc_version, loader)
+            if key in _memo:
+                result[pid] = _memo[key]
+            else:
+                todo.append(pid)
+    if not todo:
+        return result
+
+    projects = {}
+    for p in get_projects(todo):
+        projects[p["id"]] = p
+        projects[p["slug"]] = p
+
+    candidates = []
+    for pid in todo:
+        p = projects.get(pid)
+        if p is None:
+            result[pid] = None
+            continue
+        if loader and p.get("project_type") == "mod" and loader not in p.get("loaders", []):
+            result[pid] = None
+        elif mc_version and mc_version not in p.get("game_versions", []):
+            result[pid] = None
+        else:
+            candidates.append(pid)
+
+    recent_ids = [vid for pid in candidates for vid in projects[pid].get("versions", [])[-RECENT_VERSIONS:]]
+    by_project = {}
+    for v in get_versions(recent_ids):
+        by_project.setdefault(v["project_id"], []).append(v)
+
+    fallback = []
+    for pid in candidates:
+        v = newest_match(by_project.get(projects[pid]["id"], []), mc_version, loader)
+        if v:
+            result[pid] = (v, pick_file(v))
+        else:
+            fallback.append(pid)
+
+    def lookup(pid):
+        v = newest_match(get_filtered_versions(projects[pid]["id"], mc_version, loader), mc_version, loader)
+        return pid, ((v, pick_file(v)) if v else None)
+
+    if fallback:
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            for pid, found in pool.map(lookup, fallback):
+                result[pid] = found
+
+    with _memo_lock:
+        for pid in todo:
+            _memo[(pid, mc_version, loader)] = result.get(pid)
+    return result
@@ -0,0 +1,34 @@
+import platform
+
+# Evaluation of the "rules" lists found on libraries and arguments in
+# Mojang version JSONs. Shared by the installer and the launch path.
+
+
+def os_name():
+    return {"Windows": "windows", "Darwin": "osx"}.get(platform.system(), "linux")
+
+
+def arch_bits():
+    return "32" if platform.architecture()[0] == "32bit" else "64"
+
+
+def rule_matches(rule, features=None):
+    rule_os = rule.get("os", {})
+    if "name" in rule_os and rule_os["name"] != os_name():
+        return False
+    if rule_os.get("arch") == "x86" and arch_bits() != "32":
+        return False
+    for name, value in rule.get("features", {}).items():
+        if (features or {}).get(name, False) != value:
+            return False
+    return True
+
+
+def rules_allow(rules, features=None):
+    if not rules:
+        return True
+    allowed = False
+    for rule in rules:
+        if rule_matches(rule, features):
+            allowed = rule.get("action") == "allow"
+    return allowed